@@ -0,0 +1,58 @@
+"""Make the active-meals index cover the stats columns.
+
+Replaces ``ix_meal_user_localdate_active`` with a partial index that
+INCLUDEs the calorie/macro columns, so report aggregates can be served
+by an index-only scan.  Both indexes are built/dropped CONCURRENTLY to
+avoid locking ``meal_entries`` for writes.
+
+Revision ID: b7e2c4f9a013
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2c4f9a013"
+down_revision: str | None = "a1b2c3d4e5f6"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_STATS_COLUMNS = ["calories_kcal", "protein_g", "carbs_g", "fat_g"]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_meal_user_localdate_stats",
+            "meal_entries",
+            ["user_id", "local_date"],
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_include=_STATS_COLUMNS,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_meal_user_localdate_active",
+            table_name="meal_entries",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_meal_user_localdate_active",
+            "meal_entries",
+            ["user_id", "local_date"],
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_meal_user_localdate_stats",
+            table_name="meal_entries",
+            postgresql_concurrently=True,
+        )
@@ -26,6 +26,7 @@ from app.bot.middlewares import (
 )
 from app.core.config import Settings
 from app.services.nutrition_ai import NutritionAIService
+from app.services.nutrition_cache import AnalysisCache
 from app.services.rate_limit import ConcurrencyGuard, RateLimiter
 
 
@@ -87,6 +88,14 @@ def create_dispatcher(settings: Settings) -> Dispatcher:
         client=openai_client,
         model=settings.OPENAI_MODEL,
         timeout=settings.OPENAI_TIMEOUT_SECONDS,
+        cache=(
+            AnalysisCache(
+                ttl_seconds=settings.AI_CACHE_TTL_SECONDS,
+                max_entries=settings.AI_CACHE_MAX_ENTRIES,
+            )
+            if settings.AI_CACHE_TTL_SECONDS
+            else None
+        ),
     )
 
     # --- Wire admin handler settings ---
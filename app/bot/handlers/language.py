@@ -43,14 +43,14 @@ async def on_language_selected(callback: CallbackQuery, session: AsyncSession) -
         return
 
     lang = callback.data.split(":", 1)[1].upper()
-    if lang not in _LANG_LABELS:
+    label = _LANG_LABELS.get(lang)
+    if label is None:
         await callback.answer(t("lang_unknown", "EN"), show_alert=True)
         return
 
     user = await UserRepo.get_or_create(session, callback.from_user.id)
     await UserRepo.update_language(session, user.id, lang)
 
-    label = _LANG_LABELS[lang]
     await callback.message.edit_text(t("lang_set_confirmation", lang).format(label=label))  # type: ignore[union-attr]
     # Refresh reply keyboard with newly-localized button labels
     await callback.message.answer(  # type: ignore[union-attr]
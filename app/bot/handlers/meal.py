@@ -33,7 +33,12 @@ from app.core.time import today_local, user_timezone
 from app.db.repos import MealRepo, UserRepo
 from app.i18n import t
 from app.reports.stats import today_stats
-from app.services.nutrition_ai import NutritionAIService, NutritionAnalysis, sanity_check
+from app.services.nutrition_ai import (
+    NutritionAIService,
+    NutritionAnalysis,
+    dump_ingredients,
+    sanity_check,
+)
 from app.services.precheck import (
     REJECT_NOT_TEXT_OR_PHOTO,
     check_message_type,
@@ -788,7 +793,7 @@ async def _handle_analysis_result(
             weight_g=analysis.weight_g,
             volume_ml=analysis.volume_ml,
             caffeine_mg=analysis.caffeine_mg,
-            likely_ingredients_json=[i.model_dump() for i in analysis.likely_ingredients],
+            likely_ingredients_json=dump_ingredients(analysis.likely_ingredients),
             raw_ai_response=analysis.model_dump(),
         )
         meal_id_str = str(edit_meal_id)
@@ -819,7 +824,7 @@ async def _handle_analysis_result(
             weight_g=analysis.weight_g,
             volume_ml=analysis.volume_ml,
             caffeine_mg=analysis.caffeine_mg,
-            likely_ingredients_json=[i.model_dump() for i in analysis.likely_ingredients],
+            likely_ingredients_json=dump_ingredients(analysis.likely_ingredients),
             raw_ai_response=analysis.model_dump(),
         )
         meal_id_str = str(meal.id)
@@ -8,6 +8,8 @@ All user-facing labels are resolved via ``t(key, lang)`` for i18n.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from aiogram.types import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
@@ -139,21 +141,32 @@ _TZ_CITIES: list[tuple[str, str]] = [
 ]
 
 
-def timezone_city_keyboard(lang: str = "EN") -> InlineKeyboardMarkup:
-    """Inline keyboard with popular cities (IANA timezones)."""
-    rows = []
-    for label, iana in _TZ_CITIES:
-        rows.append([InlineKeyboardButton(text=label, callback_data=f"tz_city:{iana}")])
-    rows.append(
-        [InlineKeyboardButton(
-            text=t("kb_choose_offset", lang), callback_data="tz_offset_menu",
-        )]
+# The timezone pickers depend only on *lang* and are sent on every
+# intercepted update by the onboarding gate, so their layout is computed
+# once per language.  Only plain ``(text, callback_data)`` pairs are
+# cached; buttons and markup are rebuilt on each call because aiogram
+# models are mutable and a shared instance would leak edits to everyone.
+_Layout = tuple[tuple[tuple[str, str], ...], ...]
+
+
+def _build_inline(layout: _Layout) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text=text, callback_data=data) for text, data in row]
+            for row in layout
+        ]
     )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
-def timezone_offset_keyboard(lang: str = "EN") -> InlineKeyboardMarkup:
-    """Inline keyboard with UTC offsets from UTC-12 to UTC+14."""
+@lru_cache(maxsize=8)
+def _timezone_city_layout(lang: str) -> _Layout:
+    rows = [((label, f"tz_city:{iana}"),) for label, iana in _TZ_CITIES]
+    rows.append(((t("kb_choose_offset", lang), "tz_offset_menu"),))
+    return tuple(rows)
+
+
+@lru_cache(maxsize=8)
+def _timezone_offset_layout(lang: str) -> _Layout:
     rows = []
     # Group in rows of 4
     offsets = list(range(-12, 15))  # -12 to +14
@@ -164,12 +177,20 @@ def timezone_offset_keyboard(lang: str = "EN") -> InlineKeyboardMarkup:
             sign = "+" if off >= 0 else ""
             label = f"UTC{sign}{off}"
             minutes = off * 60
-            row.append(InlineKeyboardButton(text=label, callback_data=f"tz_offset:{minutes}"))
-        rows.append(row)
-    rows.append(
-        [InlineKeyboardButton(text=t("kb_choose_city", lang), callback_data="tz_city_menu")]
-    )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+            row.append((label, f"tz_offset:{minutes}"))
+        rows.append(tuple(row))
+    rows.append(((t("kb_choose_city", lang), "tz_city_menu"),))
+    return tuple(rows)
+
+
+def timezone_city_keyboard(lang: str = "EN") -> InlineKeyboardMarkup:
+    """Inline keyboard with popular cities (IANA timezones)."""
+    return _build_inline(_timezone_city_layout(lang))
+
+
+def timezone_offset_keyboard(lang: str = "EN") -> InlineKeyboardMarkup:
+    """Inline keyboard with UTC offsets from UTC-12 to UTC+14."""
+    return _build_inline(_timezone_offset_layout(lang))
 
 
 # ---------------------------------------------------------------------------
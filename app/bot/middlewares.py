@@ -17,6 +17,7 @@ set and redirects to the onboarding flow (spec D2/FEAT-03).
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from contextvars import ContextVar
 from typing import Any, Awaitable, Callable
 
@@ -186,10 +187,10 @@ ONBOARDING_TEXT_B = t("onboarding_b", "EN")
 _TZ_CALLBACK_PREFIXES = ("tz_city:", "tz_offset:", "tz_city_menu", "tz_offset_menu", "lang:")
 
 # Commands that are allowed even without timezone.
-_ALLOWED_COMMANDS = {
+_ALLOWED_COMMANDS: frozenset[str] = frozenset({
     "/start", "/help", "/language", "/version",
     "/admin_ping", "/admin_stats", "/admin_limits",
-}
+})
 
 
 class TimezoneGateMiddleware(BaseMiddleware):
@@ -205,8 +206,20 @@ class TimezoneGateMiddleware(BaseMiddleware):
     **Intercepted when timezone is missing:**
     - Any other message (text, photo, command) → show onboarding + picker
     - Any non-timezone callback → answer with prompt to set timezone
+
+    Users seen with a timezone are remembered in memory (LRU, up to
+    *max_cached_users*) and skip the DB lookup on later updates.  This is
+    safe because ``tz_mode`` is never cleared once set.
+
+    Args:
+        max_cached_users: Upper bound on remembered onboarded users.
     """
 
+    def __init__(self, max_cached_users: int = 10_000) -> None:
+        self._max_cached = max_cached_users
+        self._tz_ready: OrderedDict[int, None] = OrderedDict()
+        super().__init__()
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
@@ -226,6 +239,11 @@ class TimezoneGateMiddleware(BaseMiddleware):
         if self._is_always_allowed(event):
             return await handler(event, data)
 
+        # Timezone already known to be set — no DB lookup needed.
+        if tg_user_id in self._tz_ready:
+            self._tz_ready.move_to_end(tg_user_id)
+            return await handler(event, data)
+
         # Look up user timezone.  Session is already injected by DBSessionMiddleware.
         session: AsyncSession | None = data.get("session")
         if session is None:
@@ -234,7 +252,10 @@ class TimezoneGateMiddleware(BaseMiddleware):
 
         user = await UserRepo.get_or_create(session, tg_user_id)
         if user.tz_mode is not None:
-            # Timezone is set — pass through.
+            # Timezone is set — remember it and pass through.
+            self._tz_ready[tg_user_id] = None
+            if len(self._tz_ready) > self._max_cached:
+                self._tz_ready.popitem(last=False)
             return await handler(event, data)
 
         # --- Timezone NOT set: intercept ---
@@ -266,17 +287,13 @@ class TimezoneGateMiddleware(BaseMiddleware):
             text = update.message.text.strip()
             if text.startswith("/"):
                 # Extract bare command: "/start payload" → "/start"
-                cmd = text.split()[0]
+                cmd = text.split(maxsplit=1)[0]
                 if cmd in _ALLOWED_COMMANDS:
                     return True
 
         # Allow timezone-related callbacks.
-        if update.callback_query and update.callback_query.data:
-            cb = update.callback_query.data
-            if any(cb.startswith(prefix) for prefix in _TZ_CALLBACK_PREFIXES):
-                return True
-
-        return False
+        cb = update.callback_query
+        return bool(cb and cb.data and cb.data.startswith(_TZ_CALLBACK_PREFIXES))
 
     @staticmethod
     async def _send_onboarding(update: Update, lang: str = "EN") -> None:
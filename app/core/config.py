@@ -38,6 +38,10 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_PER_USER: int = 1
     PORT: int = 8000
 
+    # --- OpenAI response cache (0 TTL disables) ---------------------------
+    AI_CACHE_TTL_SECONDS: int = 3600
+    AI_CACHE_MAX_ENTRIES: int = 1000
+
     # --- Edit / Delete windows --------------------------------------------
     EDIT_WINDOW_HOURS: int = 48
     DELETE_WINDOW_HOURS: int = 48
@@ -98,6 +102,7 @@ class Settings(BaseSettings):
         "PURGE_DELETED_AFTER_DAYS",
         "REMINDER_INACTIVITY_HOURS",
         "REMINDER_COOLDOWN_HOURS",
+        "AI_CACHE_MAX_ENTRIES",
     )
     @classmethod
     def _validate_positive(cls, v: int) -> int:
@@ -105,6 +110,13 @@ class Settings(BaseSettings):
             raise ValueError("Value must be positive")
         return v
 
+    @field_validator("AI_CACHE_TTL_SECONDS")
+    @classmethod
+    def _validate_cache_ttl(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("AI_CACHE_TTL_SECONDS must not be negative")
+        return v
+
     @field_validator("MAX_CONCURRENT_PER_USER")
     @classmethod
     def _validate_concurrency(cls, v: int) -> int:
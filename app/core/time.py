@@ -8,8 +8,28 @@ current timezone; existing meals are never re-bucketed.
 from __future__ import annotations
 
 import datetime as _dt
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
+# timedelta(days=0..6), indexed by weekday offset.
+_DAYS = tuple(_dt.timedelta(days=i) for i in range(7))
+
+
+@lru_cache(maxsize=512)
+def _zone(tz_name: str) -> ZoneInfo:
+    """Cached ``ZoneInfo`` lookup.
+
+    ``ZoneInfo`` keeps only a small strong cache of its own, so with many
+    distinct user timezones most lookups would re-read the tz database.
+    """
+    return ZoneInfo(tz_name)
+
+
+@lru_cache(maxsize=512)
+def _fixed_offset(minutes: int) -> _dt.timezone:
+    """Cached fixed-offset ``timezone`` for *minutes* east of UTC."""
+    return _dt.timezone(_dt.timedelta(minutes=minutes))
+
 
 def user_timezone(
     tz_mode: str | None,
@@ -28,9 +48,9 @@ def user_timezone(
         Falls back to UTC if settings are incomplete.
     """
     if tz_mode == "city" and tz_name:
-        return ZoneInfo(tz_name)
+        return _zone(tz_name)
     if tz_mode == "offset" and tz_offset_minutes is not None:
-        return _dt.timezone(_dt.timedelta(minutes=tz_offset_minutes))
+        return _fixed_offset(tz_offset_minutes)
     return _dt.timezone.utc
 
 
@@ -65,9 +85,8 @@ def week_bounds(d: _dt.date) -> tuple[_dt.date, _dt.date]:
     Returns:
         ``(monday, sunday)`` inclusive.
     """
-    monday = d - _dt.timedelta(days=d.weekday())  # weekday(): Mon=0
-    sunday = monday + _dt.timedelta(days=6)
-    return monday, sunday
+    monday = d - _DAYS[d.weekday()]  # weekday(): Mon=0
+    return monday, monday + _DAYS[6]
 
 
 def last_7_days(today: _dt.date) -> list[_dt.date]:
@@ -95,14 +114,9 @@ def last_28_days_weeks(today: _dt.date) -> list[tuple[_dt.date, _dt.date]]:
     oldest_monday = start - _dt.timedelta(days=start.weekday())
     newest_monday = today - _dt.timedelta(days=today.weekday())
 
-    weeks: list[tuple[_dt.date, _dt.date]] = []
-    mon = newest_monday
-    while mon >= oldest_monday:
-        sun = mon + _dt.timedelta(days=6)
-        weeks.append((mon, sun))
-        mon -= _dt.timedelta(weeks=1)
-
-    return weeks  # newest week first
+    n_weeks = (newest_monday - oldest_monday).days // 7 + 1
+    # newest week first
+    return [week_bounds(newest_monday - _dt.timedelta(weeks=i)) for i in range(n_weeks)]
 
 
 def last_4_calendar_weeks(today: _dt.date) -> list[tuple[_dt.date, _dt.date]]:
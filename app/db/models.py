@@ -82,11 +82,13 @@ class MealEntry(Base):
     __tablename__ = "meal_entries"
     __table_args__ = (
         UniqueConstraint("tg_chat_id", "tg_message_id", name="uq_meal_chat_message"),
+        # Covering partial index for report aggregates (index-only scans).
         Index(
-            "ix_meal_user_localdate_active",
+            "ix_meal_user_localdate_stats",
             "user_id",
             "local_date",
             postgresql_where="is_deleted = false",
+            postgresql_include=["calories_kcal", "protein_g", "carbs_g", "fat_g"],
         ),
     )
 
@@ -141,29 +141,39 @@ async def four_week_stats(
     Returns:
         List of ``WeekAvgStats`` in the same order as *week_ranges*.
     """
-    results: list[WeekAvgStats] = []
+    if not week_ranges:
+        return []
 
-    for mon, sun in week_ranges:
-        stmt = select(
+    # One query for the whole span: per-day sums, bucketed into weeks below.
+    stmt = (
+        select(
+            MealEntry.local_date.label("day"),
             func.coalesce(func.sum(MealEntry.calories_kcal), 0).label("calories_kcal"),
             func.coalesce(func.sum(MealEntry.protein_g), 0.0).label("protein_g"),
             func.coalesce(func.sum(MealEntry.carbs_g), 0.0).label("carbs_g"),
             func.coalesce(func.sum(MealEntry.fat_g), 0.0).label("fat_g"),
-        ).where(
+        )
+        .where(
             MealEntry.user_id == user_id,
-            MealEntry.local_date >= mon,
-            MealEntry.local_date <= sun,
+            MealEntry.local_date >= min(mon for mon, _ in week_ranges),
+            MealEntry.local_date <= max(sun for _, sun in week_ranges),
             _active_meals_filter(),
         )
-        row = (await session.execute(stmt)).one()
+        .group_by(MealEntry.local_date)
+    )
+    day_rows = (await session.execute(stmt)).all()
+
+    results: list[WeekAvgStats] = []
+    for mon, sun in week_ranges:
+        in_week = [row for row in day_rows if mon <= row.day <= sun]
         results.append(
             WeekAvgStats(
                 week_start=mon,
                 week_end=sun,
-                avg_calories_kcal=round(int(row.calories_kcal) / 7, 1),
-                avg_protein_g=round(float(row.protein_g) / 7, 1),
-                avg_carbs_g=round(float(row.carbs_g) / 7, 1),
-                avg_fat_g=round(float(row.fat_g) / 7, 1),
+                avg_calories_kcal=round(sum(int(r.calories_kcal) for r in in_week) / 7, 1),
+                avg_protein_g=round(sum(float(r.protein_g) for r in in_week) / 7, 1),
+                avg_carbs_g=round(sum(float(r.carbs_g) for r in in_week) / 7, 1),
+                avg_fat_g=round(sum(float(r.fat_g) for r in in_week) / 7, 1),
             )
         )
 
@@ -10,10 +10,14 @@ from __future__ import annotations
 
 import base64
 import logging
-from typing import Literal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal
 
 from openai import AsyncOpenAI, OpenAIError
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+if TYPE_CHECKING:
+    from app.services.nutrition_cache import AnalysisCache
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +43,8 @@ class Ingredient(BaseModel):
     analysis to be treated as ``reject_unrecognized``.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     amount: str
     calories_kcal: int = Field(ge=0)
@@ -57,6 +63,8 @@ class NutritionAnalysis(BaseModel):
     data from reaching the database (e.g. on OpenAI model drift).
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     action: ActionType
     meal_name: str | None = None
     calories_kcal: int | None = Field(default=None, ge=0)
@@ -71,6 +79,15 @@ class NutritionAnalysis(BaseModel):
     confidence: float = Field(default=0.0, ge=0.0, le=1.0)
 
 
+# Validates / serializes a whole ingredient list in one pydantic-core pass.
+_INGREDIENT_LIST_ADAPTER: TypeAdapter[list[Ingredient]] = TypeAdapter(list[Ingredient])
+
+
+def dump_ingredients(ingredients: list[Ingredient]) -> list[dict]:
+    """Serialize ingredients to plain dicts (``MealEntry.likely_ingredients_json``)."""
+    return _INGREDIENT_LIST_ADAPTER.dump_python(ingredients)
+
+
 # ---------------------------------------------------------------------------
 # Sanity check limits (spec D5/FEAT-07)
 # ---------------------------------------------------------------------------
@@ -85,6 +102,24 @@ MAX_VOLUME_ML = 5_000
 MAX_CAFFEINE_MG = 2_000
 
 
+# (attribute, limit, label) triples checked by ``sanity_check``.
+_ANALYSIS_LIMITS: tuple[tuple[str, float | int, str], ...] = (
+    ("calories_kcal", MAX_CALORIES_KCAL, "Calories"),
+    ("protein_g", MAX_PROTEIN_G, "Protein"),
+    ("carbs_g", MAX_CARBS_G, "Carbs"),
+    ("fat_g", MAX_FAT_G, "Fat"),
+    ("weight_g", MAX_WEIGHT_G, "Weight"),
+    ("volume_ml", MAX_VOLUME_ML, "Volume"),
+    ("caffeine_mg", MAX_CAFFEINE_MG, "Caffeine"),
+)
+
+_INGREDIENT_LIMITS: tuple[tuple[str, float | int, str], ...] = (
+    ("calories_kcal", MAX_CALORIES_KCAL, "calories"),
+    ("weight_g", MAX_WEIGHT_G, "weight"),
+    ("volume_ml", MAX_VOLUME_ML, "volume"),
+)
+
+
 def sanity_check(analysis: NutritionAnalysis) -> str | None:
     """Validate that a ``save`` analysis has reasonable values.
 
@@ -97,28 +132,17 @@ def sanity_check(analysis: NutritionAnalysis) -> str | None:
     if analysis.action != "save":
         return None
 
-    checks: list[tuple[str, float | int | None, float | int]] = [
-        ("Calories", analysis.calories_kcal, MAX_CALORIES_KCAL),
-        ("Protein", analysis.protein_g, MAX_PROTEIN_G),
-        ("Carbs", analysis.carbs_g, MAX_CARBS_G),
-        ("Fat", analysis.fat_g, MAX_FAT_G),
-        ("Weight", analysis.weight_g, MAX_WEIGHT_G),
-        ("Volume", analysis.volume_ml, MAX_VOLUME_ML),
-        ("Caffeine", analysis.caffeine_mg, MAX_CAFFEINE_MG),
-    ]
-
-    for label, value, limit in checks:
+    for attr, limit, label in _ANALYSIS_LIMITS:
+        value = getattr(analysis, attr)
         if value is not None and value > limit:
             return f"{label} value ({value}) exceeds maximum ({limit})."
 
     # Per-ingredient checks
     for ing in analysis.likely_ingredients:
-        if ing.calories_kcal > MAX_CALORIES_KCAL:
-            return f"Ingredient '{ing.name}' calories ({ing.calories_kcal}) exceeds maximum ({MAX_CALORIES_KCAL})."
-        if ing.weight_g is not None and ing.weight_g > MAX_WEIGHT_G:
-            return f"Ingredient '{ing.name}' weight ({ing.weight_g}) exceeds maximum ({MAX_WEIGHT_G})."
-        if ing.volume_ml is not None and ing.volume_ml > MAX_VOLUME_ML:
-            return f"Ingredient '{ing.name}' volume ({ing.volume_ml}) exceeds maximum ({MAX_VOLUME_ML})."
+        for attr, limit, label in _INGREDIENT_LIMITS:
+            value = getattr(ing, attr)
+            if value is not None and value > limit:
+                return f"Ingredient '{ing.name}' {label} ({value}) exceeds maximum ({limit})."
 
     return None
 
@@ -161,10 +185,12 @@ _LANG_INSTRUCTIONS: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=16)
 def _build_system_prompt(lang: str = "EN") -> str:
     """Build the system prompt with language instruction appended.
 
-    Unknown languages fall back to English.
+    Unknown languages fall back to English.  Results are memoized per
+    ``lang`` value so the base prompt is concatenated once per language.
     """
     lang_upper = (lang or "EN").upper()
     instruction = _LANG_INSTRUCTIONS.get(lang_upper, _LANG_INSTRUCTIONS["EN"])
@@ -186,6 +212,8 @@ class NutritionAIService:
         client: An ``AsyncOpenAI`` instance.
         model: Model name (e.g. ``"gpt-4o-mini"``).
         timeout: Request timeout in seconds.
+        cache: Optional ``AnalysisCache``; identical requests are then
+            answered from memory instead of calling OpenAI again.
     """
 
     def __init__(
@@ -193,10 +221,12 @@ class NutritionAIService:
         client: AsyncOpenAI,
         model: str = "gpt-4o-mini",
         timeout: float = 30.0,
+        cache: AnalysisCache | None = None,
     ) -> None:
         self._client = client
         self._model = model
         self._timeout = timeout
+        self._cache = cache
 
     async def analyze_text(self, text: str, *, lang: str = "EN") -> NutritionAnalysis:
         """Analyze a text description of a meal.
@@ -213,7 +243,7 @@ class NutritionAIService:
             {"role": "system", "content": prompt},
             {"role": "user", "content": text},
         ]
-        return await self._call(messages)
+        return await self._call(messages, self._cache_key("text", lang, text))
 
     async def analyze_photo(
         self,
@@ -247,14 +277,33 @@ class NutritionAIService:
             {"role": "system", "content": prompt},
             {"role": "user", "content": content},
         ]
-        return await self._call(messages)
-
-    async def _call(self, messages: list[dict]) -> NutritionAnalysis:
+        return await self._call(
+            messages, self._cache_key("photo", lang, caption or "", photo_bytes)
+        )
+
+    def _cache_key(self, kind: str, lang: str, *parts: str | bytes) -> str | None:
+        """Digest identifying a request, or ``None`` when caching is off."""
+        if self._cache is None:
+            return None
+        return self._cache.key(self._model, kind, (lang or "EN").upper(), *parts)
+
+    async def _call(
+        self, messages: list[dict], cache_key: str | None = None
+    ) -> NutritionAnalysis:
         """Send request to OpenAI and parse the structured response.
 
         Any API error or malformed response is mapped to
         ``reject_unrecognized`` so the caller never sees exceptions.
+        Only successfully parsed responses are cached.
         """
+        if self._cache is not None and cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "OpenAI analysis served from cache", extra={"event": "openai_cache_hit"}
+                )
+                return cached
+
         try:
             response = await self._client.beta.chat.completions.parse(
                 model=self._model,
@@ -266,6 +315,8 @@ class NutritionAIService:
             if parsed is None:
                 logger.warning("OpenAI returned empty parsed response")
                 return NutritionAnalysis(action="reject_unrecognized")
+            if self._cache is not None and cache_key is not None:
+                self._cache.set(cache_key, parsed)
             return parsed
 
         except OpenAIError as exc:
@@ -0,0 +1,77 @@
+"""In-memory cache for OpenAI nutrition analyses.
+
+Identical requests (same model, language and text / photo + caption)
+return the previously parsed ``NutritionAnalysis`` instead of paying
+another OpenAI round-trip.  Entries expire after a TTL and the oldest
+entries are evicted once ``max_entries`` is reached.
+
+Like the rate limiter, the cache is **in-memory only** and per process.
+No lock is needed: ``get``/``set`` never await, so they cannot
+interleave on the event loop.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from app.services.nutrition_ai import NutritionAnalysis
+
+
+class AnalysisCache:
+    """TTL + LRU cache of ``NutritionAnalysis`` results keyed by request digest.
+
+    ``NutritionAnalysis`` is frozen, so cached instances are safe to share
+    between callers.
+
+    Args:
+        ttl_seconds: How long an entry stays valid.
+        max_entries: Upper bound on stored entries (least recently used
+            entries are evicted first).
+        clock: Monotonic time source in seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, NutritionAnalysis]] = OrderedDict()
+
+    @staticmethod
+    def key(*parts: str | bytes) -> str:
+        """Return a SHA-256 digest over *parts* (length-prefixed, unambiguous)."""
+        h = hashlib.sha256()
+        for part in parts:
+            data = part.encode() if isinstance(part, str) else part
+            h.update(len(data).to_bytes(8, "big"))
+            h.update(data)
+        return h.hexdigest()
+
+    def get(self, key: str) -> NutritionAnalysis | None:
+        """Return the cached analysis for *key*, or ``None`` if absent/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, analysis = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return analysis
+
+    def set(self, key: str, analysis: NutritionAnalysis) -> None:
+        """Store *analysis* under *key*, evicting the oldest entry if full."""
+        self._entries[key] = (self._clock() + self._ttl, analysis)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
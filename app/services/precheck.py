@@ -48,16 +48,23 @@ _WATER_EXACT: set[str] = {"вода", "water", "стакан воды", "поп
 
 _MEDICINE_KEYWORDS: set[str] = {"лекарство", "таблетка", "ibuprofen", "paracetamol"}
 
+# Substring match for any medicine keyword — one scan instead of one per keyword.
+_MEDICINE_RE = re.compile(
+    "|".join(map(re.escape, sorted(_MEDICINE_KEYWORDS, key=len, reverse=True)))
+)
+
 _VAGUE_WORDS: set[str] = {"вкусняшка", "еда", "поел", "ням", "что-то"}
 
 
-def _has_alnum(text: str) -> bool:
-    """Return True if *text* contains at least one Unicode letter or digit.
+# Regex: any Unicode letter or digit.  ``[^\W_]`` matches exactly the
+# characters for which ``str.isalnum()`` is true (all scripts — Latin,
+# Cyrillic, CJK, Arabic, etc.), but scans in C instead of a Python loop.
+_HAS_ALNUM = re.compile(r"[^\W_]")
 
-    Uses ``str.isalnum()`` which covers all scripts (Latin, Cyrillic,
-    CJK, Arabic, etc.), unlike a Latin/Cyrillic-only regex.
-    """
-    return any(c.isalnum() for c in text)
+
+def _has_alnum(text: str) -> bool:
+    """Return True if *text* contains at least one Unicode letter or digit."""
+    return _HAS_ALNUM.search(text) is not None
 
 
 # Regex: contains any digit.
@@ -97,9 +104,8 @@ def check_text(text: str, *, has_photo: bool) -> PrecheckResult:
         return PrecheckResult(passed=False, reject_key=REJECT_WATER)
 
     # §5.4 — medicine keywords.
-    for kw in _MEDICINE_KEYWORDS:
-        if kw in normalized:
-            return PrecheckResult(passed=False, reject_key=REJECT_NOT_TEXT_OR_PHOTO)
+    if _MEDICINE_RE.search(normalized):
+        return PrecheckResult(passed=False, reject_key=REJECT_NOT_TEXT_OR_PHOTO)
 
     # §5.5 — vague text-only (no photo, no digits, matches curated list).
     if not has_photo and not _HAS_DIGIT.search(normalized) and normalized in _VAGUE_WORDS:
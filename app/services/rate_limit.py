@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import time
 from collections import defaultdict
+from collections.abc import Callable
 
 
 class RateLimiter:
@@ -20,10 +21,16 @@ class RateLimiter:
 
     Args:
         max_per_minute: Maximum allowed requests within a 60-second window.
+        clock: Monotonic time source in seconds (injectable for tests).
     """
 
-    def __init__(self, max_per_minute: int = 6) -> None:
+    def __init__(
+        self,
+        max_per_minute: int = 6,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._max = max_per_minute
+        self._clock = clock
         self._windows: dict[int, list[float]] = defaultdict(list)
 
     def check(self, tg_user_id: int) -> bool:
@@ -32,7 +39,7 @@ class RateLimiter:
         Returns:
             ``True`` — request is allowed; ``False`` — rate-limited.
         """
-        now = time.monotonic()
+        now = self._clock()
         window = self._windows[tg_user_id]
 
         # Prune timestamps older than 60 seconds.
@@ -1,4 +1,4 @@
-"""Shared test fixtures for async DB tests.
+"""Shared test fixtures for async DB and web endpoint tests.
 
 Uses an in-memory SQLite database (via aiosqlite) so tests run
 without an external PostgreSQL instance.  JSONB columns are
@@ -8,12 +8,17 @@ rendered as plain JSON for SQLite compatibility.
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
 
 import pytest
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy import JSON, event
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.db.models import Base, MealEntry, User
 
@@ -23,21 +28,32 @@ from app.db.models import Base, MealEntry, User
 _original_jsonb_compile = None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def engine():
-    """Create an async in-memory SQLite engine with all tables.
+    """Create one async in-memory SQLite engine with all tables per test session.
 
-    Patches JSONB → JSON so that SQLite can create the tables.
+    Patches JSONB → JSON so that SQLite can create the tables.  Each test
+    runs inside a transaction that is rolled back (see ``session``), so
+    the schema is only created once.
     """
-    eng = create_async_engine("sqlite+aiosqlite://", echo=False)
+    # StaticPool keeps a single connection, so the in-memory database
+    # (and its schema) lives for the whole session.
+    eng = create_async_engine("sqlite+aiosqlite://", echo=False, poolclass=StaticPool)
 
-    # SQLite doesn't enforce FK by default; enable it.
+    # SQLite doesn't enforce FK by default; enable it.  The driver's own
+    # transaction handling is switched off so SQLAlchemy emits BEGIN
+    # itself — otherwise SAVEPOINTs don't work with pysqlite/aiosqlite.
     @event.listens_for(eng.sync_engine, "connect")
     def _set_sqlite_pragma(dbapi_conn, _):
+        dbapi_conn.isolation_level = None
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
+    @event.listens_for(eng.sync_engine, "begin")
+    def _do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Temporarily replace JSONB columns with JSON for DDL.
     jsonb_cols = []
     for table in Base.metadata.tables.values():
@@ -59,11 +75,45 @@ async def engine():
 
 @pytest.fixture
 async def session(engine):
-    """Yield an async session bound to the test engine."""
-    factory = async_sessionmaker(engine, expire_on_commit=False)
-    async with factory() as sess:
-        yield sess
-        await sess.rollback()
+    """Yield an async session inside a transaction rolled back after the test.
+
+    ``commit()``/``rollback()`` in tests and code under test only act on a
+    SAVEPOINT, so no rows leak between tests.
+    """
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as sess:
+            yield sess
+        await trans.rollback()
+
+
+@pytest.fixture(scope="session")
+async def web_client() -> AsyncIterator[AsyncClient]:
+    """One ASGI client over the FastAPI app, shared by endpoint tests.
+
+    ``ASGITransport`` does not run the lifespan, so no bot/DB is started;
+    tests patch ``app.web.main`` globals as needed.
+    """
+    from app.web.main import app
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def fake_session_factory() -> Callable[[], AbstractAsyncContextManager[AsyncMock]]:
+    """``async_sessionmaker`` stand-in whose sessions are bare ``AsyncMock``s."""
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[AsyncMock]:
+        yield AsyncMock()
+
+    return factory
 
 
 @pytest.fixture
@@ -175,8 +175,9 @@ class TestAutoSave:
     async def test_reject_custom(self) -> None:
         """action='reject_other' → reply with user_message."""
         msg = _make_message()
-        analysis = _make_analysis(action="reject_not_food")
-        analysis.user_message = "That doesn't look like food."
+        analysis = _make_analysis(action="reject_not_food").model_copy(
+            update={"user_message": "That doesn't look like food."}
+        )
 
         session = AsyncMock(spec=AsyncSession)
         await _handle_analysis_result(msg, session, analysis, source="text")
@@ -264,9 +265,9 @@ class TestAutoSave:
     async def test_saved_text_contains_stats(self) -> None:
         """Reply should contain both meal info and Today's Stats."""
         msg = _make_message()
-        analysis = _make_analysis(action="save")
-        analysis.meal_name = "Grilled Salmon"
-        analysis.calories_kcal = 450
+        analysis = _make_analysis(action="save").model_copy(
+            update={"meal_name": "Grilled Salmon", "calories_kcal": 450}
+        )
         user = _make_user()
         fake_meal = _make_meal(user)
 
@@ -160,3 +160,26 @@ class TestAdminIds:
         monkeypatch.setenv("ADMIN_IDS", "111,222,333")
         s = Settings(_env_file=None)  # type: ignore[call-arg]
         assert s.admin_ids_list == [111, 222, 333]
+
+
+# ---------------------------------------------------------------------------
+# OpenAI response cache
+# ---------------------------------------------------------------------------
+class TestAICache:
+    def test_defaults(self) -> None:
+        s = _make()
+        assert s.AI_CACHE_TTL_SECONDS == 3600
+        assert s.AI_CACHE_MAX_ENTRIES == 1000
+
+    def test_zero_ttl_allowed(self) -> None:
+        """0 disables the cache."""
+        s = _make(AI_CACHE_TTL_SECONDS=0)
+        assert s.AI_CACHE_TTL_SECONDS == 0
+
+    def test_negative_ttl_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="must not be negative"):
+            _make(AI_CACHE_TTL_SECONDS=-1)
+
+    def test_zero_max_entries_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="must be positive"):
+            _make(AI_CACHE_MAX_ENTRIES=0)
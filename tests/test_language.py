@@ -12,6 +12,7 @@ Verifies:
 from __future__ import annotations
 
 import uuid
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -39,17 +40,14 @@ def _make_message(tg_user_id: int = 111) -> AsyncMock:
     return msg
 
 
-def _make_callback(data: str, tg_user_id: int = 111) -> AsyncMock:
-    """Create a mock CallbackQuery."""
-    cb = AsyncMock()
-    cb.data = data
-    cb.from_user = MagicMock()
-    cb.from_user.id = tg_user_id
-    cb.message = AsyncMock()
-    cb.message.edit_text = AsyncMock()
-    cb.message.answer = AsyncMock()
-    cb.answer = AsyncMock()
-    return cb
+def _make_callback(data: str, tg_user_id: int = 111) -> SimpleNamespace:
+    """Build a fake CallbackQuery (only the awaited methods are mocks)."""
+    return SimpleNamespace(
+        data=data,
+        from_user=SimpleNamespace(id=tg_user_id),
+        message=SimpleNamespace(edit_text=AsyncMock(), answer=AsyncMock()),
+        answer=AsyncMock(),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
-from openai import APITimeoutError
+from openai import APIConnectionError, APITimeoutError
+from pydantic import ValidationError
 
 from app.services.nutrition_ai import (
     MAX_CAFFEINE_MG,
@@ -19,6 +21,8 @@ from app.services.nutrition_ai import (
     Ingredient,
     NutritionAIService,
     NutritionAnalysis,
+    dump_ingredients,
+    _INGREDIENT_LIST_ADAPTER,
     _build_system_prompt,
     _LANG_INSTRUCTIONS,
     _SYSTEM_PROMPT_BASE,
@@ -30,46 +34,119 @@ from app.services.nutrition_ai import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+_FAKE_JPEG = b"\xff\xd8fake_jpeg"
 
-def _make_service(mock_client: AsyncMock | None = None) -> NutritionAIService:
+
+def _parse_spec(*args: object, **kwargs: object) -> None:
+    """Permissive signature for the mocked ``parse`` — accepts any call."""
+
+
+def _make_client() -> SimpleNamespace:
+    """Minimal OpenAI client stand-in: only ``beta.chat.completions.parse`` is mocked.
+
+    ``parse`` is spec'd to a plain function so stray attribute access does
+    not spawn child mocks.
+    """
+    parse = AsyncMock(spec=_parse_spec)
+    return SimpleNamespace(
+        beta=SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(parse=parse)))
+    )
+
+
+def _make_service(mock_client: SimpleNamespace | None = None) -> NutritionAIService:
     """Create a service with a mock OpenAI client."""
-    client = mock_client or AsyncMock()
+    client = mock_client or _make_client()
     return NutritionAIService(client=client, model="gpt-4o-mini", timeout=10.0)
 
 
-def _mock_parse_response(analysis: NutritionAnalysis) -> AsyncMock:
-    """Build a mock client whose beta.chat.completions.parse returns *analysis*."""
-    client = AsyncMock()
-    choice = MagicMock()
-    choice.message.parsed = analysis
-    response = MagicMock()
-    response.choices = [choice]
-    client.beta.chat.completions.parse.return_value = response
-    return client
+def _build_response(analysis: NutritionAnalysis | None) -> SimpleNamespace:
+    """Build a parse() response whose first choice carries *analysis*."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(parsed=analysis))])
+
+
+@pytest.fixture(scope="module")
+def client() -> SimpleNamespace:
+    """One mock OpenAI client shared by every test in the module."""
+    return _make_client()
+
+
+@pytest.fixture(scope="module")
+def svc(client: SimpleNamespace) -> NutritionAIService:
+    """Service bound to the shared mock client."""
+    return _make_service(client)
+
+
+@pytest.fixture(scope="module")
+def respond_with(client: SimpleNamespace):
+    """Factory: make the shared client's ``parse()`` return *analysis*.
+
+    One response skeleton is built per module; only ``parsed`` is rebound.
+    """
+
+    response = _build_response(None)
+    message = response.choices[0].message
+
+    def _respond(analysis: NutritionAnalysis | None) -> None:
+        message.parsed = analysis
+        client.beta.chat.completions.parse.return_value = response
+
+    return _respond
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(client: SimpleNamespace):
+    """Drop the previous test's return value, side effect and call history."""
+    yield
+    client.beta.chat.completions.parse.reset_mock(return_value=True, side_effect=True)
 
 
 # ---------------------------------------------------------------------------
 # action: save
 # ---------------------------------------------------------------------------
 
+# Read-only expected analyses, validated once at import.
+_EXPECTED_CHICKEN = NutritionAnalysis(
+    action="save",
+    meal_name="Chicken breast",
+    calories_kcal=250,
+    protein_g=40.0,
+    carbs_g=0.0,
+    fat_g=8.0,
+    weight_g=200,
+    likely_ingredients=[
+        Ingredient(name="chicken breast", amount="200g", calories_kcal=250),
+    ],
+    confidence=0.9,
+)
+
+_EXPECTED_PIZZA = NutritionAnalysis(
+    action="save",
+    meal_name="Pizza slice",
+    calories_kcal=300,
+    protein_g=12.0,
+    carbs_g=35.0,
+    fat_g=14.0,
+    likely_ingredients=[
+        Ingredient(name="pizza dough", amount="100g", calories_kcal=150),
+        Ingredient(name="cheese", amount="30g", calories_kcal=100),
+    ],
+    confidence=0.8,
+)
+
+_EXPECTED_FOOD = NutritionAnalysis(
+    action="save",
+    meal_name="Food",
+    calories_kcal=100,
+    protein_g=5.0,
+    carbs_g=10.0,
+    fat_g=3.0,
+    confidence=0.5,
+)
+
 
 class TestSaveAction:
-    async def test_text_returns_analysis(self):
-        expected = NutritionAnalysis(
-            action="save",
-            meal_name="Chicken breast",
-            calories_kcal=250,
-            protein_g=40.0,
-            carbs_g=0.0,
-            fat_g=8.0,
-            weight_g=200,
-            likely_ingredients=[
-                Ingredient(name="chicken breast", amount="200g", calories_kcal=250),
-            ],
-            confidence=0.9,
-        )
-        client = _mock_parse_response(expected)
-        svc = _make_service(client)
+    async def test_text_returns_analysis(self, svc, respond_with):
+        respond_with(_EXPECTED_CHICKEN)
 
         result = await svc.analyze_text("chicken breast 200g")
         assert result.action == "save"
@@ -77,41 +154,17 @@ class TestSaveAction:
         assert result.protein_g == 40.0
         assert len(result.likely_ingredients) == 1
 
-    async def test_photo_returns_analysis(self):
-        expected = NutritionAnalysis(
-            action="save",
-            meal_name="Pizza slice",
-            calories_kcal=300,
-            protein_g=12.0,
-            carbs_g=35.0,
-            fat_g=14.0,
-            likely_ingredients=[
-                Ingredient(name="pizza dough", amount="100g", calories_kcal=150),
-                Ingredient(name="cheese", amount="30g", calories_kcal=100),
-            ],
-            confidence=0.8,
-        )
-        client = _mock_parse_response(expected)
-        svc = _make_service(client)
+    async def test_photo_returns_analysis(self, svc, respond_with):
+        respond_with(_EXPECTED_PIZZA)
 
-        result = await svc.analyze_photo(b"\xff\xd8fake_jpeg", caption="pizza")
+        result = await svc.analyze_photo(_FAKE_JPEG, caption="pizza")
         assert result.action == "save"
         assert result.meal_name == "Pizza slice"
 
-    async def test_photo_without_caption(self):
-        expected = NutritionAnalysis(
-            action="save",
-            meal_name="Food",
-            calories_kcal=100,
-            protein_g=5.0,
-            carbs_g=10.0,
-            fat_g=3.0,
-            confidence=0.5,
-        )
-        client = _mock_parse_response(expected)
-        svc = _make_service(client)
+    async def test_photo_without_caption(self, svc, respond_with):
+        respond_with(_EXPECTED_FOOD)
 
-        result = await svc.analyze_photo(b"\xff\xd8fake_jpeg")
+        result = await svc.analyze_photo(_FAKE_JPEG)
         assert result.action == "save"
 
 
@@ -130,13 +183,12 @@ class TestRejectActions:
             "reject_unrecognized",
         ],
     )
-    async def test_reject_actions_returned(self, action: str):
+    async def test_reject_actions_returned(self, svc, respond_with, action: str):
         expected = NutritionAnalysis(
             action=action,
             user_message="Some reason" if action != "reject_unrecognized" else None,
         )
-        client = _mock_parse_response(expected)
-        svc = _make_service(client)
+        respond_with(expected)
 
         result = await svc.analyze_text("something")
         assert result.action == action
@@ -147,42 +199,27 @@ class TestRejectActions:
 # ---------------------------------------------------------------------------
 
 
-class TestErrorHandling:
-    async def test_api_timeout_returns_reject_unrecognized(self):
-        client = AsyncMock()
-        client.beta.chat.completions.parse.side_effect = APITimeoutError(request=MagicMock())
-        svc = _make_service(client)
-
-        result = await svc.analyze_text("chicken")
-        assert result.action == "reject_unrecognized"
-
-    async def test_generic_openai_error_returns_reject_unrecognized(self):
-        from openai import APIConnectionError
-
-        client = AsyncMock()
-        client.beta.chat.completions.parse.side_effect = APIConnectionError(request=MagicMock())
-        svc = _make_service(client)
-
-        result = await svc.analyze_text("chicken")
-        assert result.action == "reject_unrecognized"
+# OpenAI error classes only store the request; no need for a real httpx.Request.
+_FAKE_REQUEST = SimpleNamespace()
 
-    async def test_unexpected_exception_returns_reject_unrecognized(self):
-        client = AsyncMock()
-        client.beta.chat.completions.parse.side_effect = ValueError("unexpected")
-        svc = _make_service(client)
 
-        result = await svc.analyze_text("chicken")
-        assert result.action == "reject_unrecognized"
-
-    async def test_none_parsed_returns_reject_unrecognized(self):
-        """OpenAI returns a response but parsed is None (e.g. refusal)."""
-        client = AsyncMock()
-        choice = MagicMock()
-        choice.message.parsed = None
-        response = MagicMock()
-        response.choices = [choice]
-        client.beta.chat.completions.parse.return_value = response
-        svc = _make_service(client)
+class TestErrorHandling:
+    @pytest.mark.parametrize(
+        "outcome",
+        [
+            pytest.param(APITimeoutError(request=_FAKE_REQUEST), id="api_timeout"),
+            pytest.param(APIConnectionError(request=_FAKE_REQUEST), id="generic_openai_error"),
+            pytest.param(ValueError("unexpected"), id="unexpected_exception"),
+            # OpenAI returns a response but parsed is None (e.g. refusal).
+            pytest.param(_build_response(None), id="none_parsed"),
+        ],
+    )
+    async def test_failure_returns_reject_unrecognized(self, client, svc, outcome):
+        parse = client.beta.chat.completions.parse
+        if isinstance(outcome, Exception):
+            parse.side_effect = outcome
+        else:
+            parse.return_value = outcome
 
         result = await svc.analyze_text("chicken")
         assert result.action == "reject_unrecognized"
@@ -219,31 +256,28 @@ class TestNutritionAnalysisModel:
         assert len(m.likely_ingredients) == 1
 
     def test_invalid_action_rejected(self):
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             NutritionAnalysis(action="invalid_action")
 
-    def test_negative_calories_rejected(self):
-        with pytest.raises(Exception):
-            NutritionAnalysis(action="save", calories_kcal=-100)
-
-    def test_negative_protein_rejected(self):
-        with pytest.raises(Exception):
-            NutritionAnalysis(action="save", protein_g=-5.0)
-
-    def test_negative_fat_rejected(self):
-        with pytest.raises(Exception):
-            NutritionAnalysis(action="save", fat_g=-1.0)
-
-    def test_negative_carbs_rejected(self):
-        with pytest.raises(Exception):
-            NutritionAnalysis(action="save", carbs_g=-10.0)
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("calories_kcal", -100),
+            ("protein_g", -5.0),
+            ("fat_g", -1.0),
+            ("carbs_g", -10.0),
+        ],
+    )
+    def test_negative_value_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            NutritionAnalysis(action="save", **{field: value})
 
     def test_negative_ingredient_calories_rejected(self):
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             Ingredient(name="test", amount="100g", calories_kcal=-50)
 
     def test_confidence_out_of_range_rejected(self):
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             NutritionAnalysis(action="save", confidence=1.5)
 
     def test_none_values_still_valid(self):
@@ -270,19 +304,26 @@ class TestNutritionAnalysisModel:
 
 
 class TestIngredientWeightVolume:
+    # Attribute/serialization checks use model_construct (no validation);
+    # anything asserting accept/reject goes through the validating constructor.
+
     def test_ingredient_with_weight(self):
-        ing = Ingredient(name="rice", amount="150g", calories_kcal=200, weight_g=150)
+        ing = Ingredient.model_construct(
+            name="rice", amount="150g", calories_kcal=200, weight_g=150,
+        )
         assert ing.weight_g == 150
         assert ing.volume_ml is None
 
     def test_ingredient_with_volume(self):
-        ing = Ingredient(name="milk", amount="200ml", calories_kcal=90, volume_ml=200)
+        ing = Ingredient.model_construct(
+            name="milk", amount="200ml", calories_kcal=90, volume_ml=200,
+        )
         assert ing.volume_ml == 200
         assert ing.weight_g is None
 
     def test_ingredient_with_both(self):
         """Soup ingredient may have both weight and volume."""
-        ing = Ingredient(
+        ing = Ingredient.model_construct(
             name="soup", amount="300ml", calories_kcal=120,
             weight_g=320, volume_ml=300,
         )
@@ -291,17 +332,14 @@ class TestIngredientWeightVolume:
 
     def test_ingredient_defaults_none(self):
         """Without explicit weight/volume, defaults to None (backward compat)."""
-        ing = Ingredient(name="chicken", amount="100g", calories_kcal=165)
+        ing = Ingredient.model_construct(name="chicken", amount="100g", calories_kcal=165)
         assert ing.weight_g is None
         assert ing.volume_ml is None
 
-    def test_ingredient_negative_weight_rejected(self):
-        with pytest.raises(Exception):
-            Ingredient(name="x", amount="x", calories_kcal=0, weight_g=-1)
-
-    def test_ingredient_negative_volume_rejected(self):
-        with pytest.raises(Exception):
-            Ingredient(name="x", amount="x", calories_kcal=0, volume_ml=-5)
+    @pytest.mark.parametrize("field,value", [("weight_g", -1), ("volume_ml", -5)])
+    def test_ingredient_negative_value_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            Ingredient(name="x", amount="x", calories_kcal=0, **{field: value})
 
     def test_ingredient_zero_weight_valid(self):
         ing = Ingredient(name="spice", amount="pinch", calories_kcal=0, weight_g=0)
@@ -319,7 +357,7 @@ class TestIngredientWeightVolume:
 
     def test_ingredient_serialization_includes_fields(self):
         """model_dump() includes weight_g and volume_ml for JSONB storage."""
-        ing = Ingredient(
+        ing = Ingredient.model_construct(
             name="rice", amount="150g", calories_kcal=200,
             weight_g=150, volume_ml=None,
         )
@@ -329,83 +367,74 @@ class TestIngredientWeightVolume:
         assert d["weight_g"] == 150
         assert d["volume_ml"] is None
 
+    def test_dump_ingredients_matches_model_dump(self):
+        """Batch serialization for JSONB equals per-item model_dump()."""
+        ings = [
+            Ingredient(name="rice", amount="150g", calories_kcal=200, weight_g=150),
+            Ingredient(name="milk", amount="200ml", calories_kcal=90, volume_ml=200),
+        ]
+        assert dump_ingredients(ings) == [i.model_dump() for i in ings]
+
 
 # ---------------------------------------------------------------------------
 # Sanity checks (Step 08, D5/FEAT-07)
 # ---------------------------------------------------------------------------
 
+# Validated once; limit tests derive variants via model_copy (no re-validation).
+_BASE_SAVE = NutritionAnalysis(
+    action="save", calories_kcal=100, protein_g=10.0, carbs_g=10.0, fat_g=10.0,
+)
 
-class TestSanityCheck:
-    def test_normal_values_pass(self):
-        a = NutritionAnalysis(
-            action="save", calories_kcal=500, protein_g=30.0,
-            carbs_g=50.0, fat_g=20.0, weight_g=300,
-        )
-        assert sanity_check(a) is None
 
-    def test_reject_actions_always_pass(self):
-        a = NutritionAnalysis(action="reject_not_food")
-        assert sanity_check(a) is None
+_NORMAL_SAVE = NutritionAnalysis(
+    action="save", calories_kcal=500, protein_g=30.0, carbs_g=50.0, fat_g=20.0, weight_g=300,
+)
 
-    def test_absurd_calories_rejected(self):
-        a = NutritionAnalysis(action="save", calories_kcal=MAX_CALORIES_KCAL + 1)
-        result = sanity_check(a)
-        assert result is not None
-        assert "Calories" in result
+_AT_LIMIT_SAVE = NutritionAnalysis(
+    action="save",
+    calories_kcal=MAX_CALORIES_KCAL,
+    protein_g=MAX_PROTEIN_G,
+    carbs_g=MAX_CARBS_G,
+    fat_g=MAX_FAT_G,
+    weight_g=MAX_WEIGHT_G,
+    volume_ml=MAX_VOLUME_ML,
+    caffeine_mg=MAX_CAFFEINE_MG,
+)
 
-    def test_absurd_protein_rejected(self):
-        a = NutritionAnalysis(action="save", protein_g=MAX_PROTEIN_G + 1)
-        result = sanity_check(a)
-        assert result is not None
-        assert "Protein" in result
+# Only calories set — the remaining None fields must not trip the check.
+_CALORIES_ONLY_SAVE = NutritionAnalysis(action="save", calories_kcal=200)
 
-    def test_absurd_carbs_rejected(self):
-        a = NutritionAnalysis(action="save", carbs_g=MAX_CARBS_G + 1)
-        result = sanity_check(a)
-        assert result is not None
-        assert "Carbs" in result
 
-    def test_absurd_fat_rejected(self):
-        a = NutritionAnalysis(action="save", fat_g=MAX_FAT_G + 1)
-        result = sanity_check(a)
-        assert result is not None
-        assert "Fat" in result
-
-    def test_absurd_weight_rejected(self):
-        a = NutritionAnalysis(action="save", weight_g=MAX_WEIGHT_G + 1)
-        result = sanity_check(a)
-        assert result is not None
-        assert "Weight" in result
+class TestSanityCheck:
+    @pytest.mark.parametrize(
+        "analysis",
+        [_NORMAL_SAVE, _AT_LIMIT_SAVE, _CALORIES_ONLY_SAVE],
+        ids=["normal", "at_limit", "calories_only"],
+    )
+    def test_plausible_values_pass(self, analysis):
+        assert sanity_check(analysis) is None
 
-    def test_absurd_volume_rejected(self):
-        a = NutritionAnalysis(action="save", volume_ml=MAX_VOLUME_ML + 1)
-        result = sanity_check(a)
-        assert result is not None
-        assert "Volume" in result
+    def test_reject_actions_always_pass(self):
+        a = NutritionAnalysis(action="reject_not_food")
+        assert sanity_check(a) is None
 
-    def test_absurd_caffeine_rejected(self):
-        a = NutritionAnalysis(action="save", caffeine_mg=MAX_CAFFEINE_MG + 1)
+    @pytest.mark.parametrize(
+        "field,limit,label",
+        [
+            ("calories_kcal", MAX_CALORIES_KCAL, "Calories"),
+            ("protein_g", MAX_PROTEIN_G, "Protein"),
+            ("carbs_g", MAX_CARBS_G, "Carbs"),
+            ("fat_g", MAX_FAT_G, "Fat"),
+            ("weight_g", MAX_WEIGHT_G, "Weight"),
+            ("volume_ml", MAX_VOLUME_ML, "Volume"),
+            ("caffeine_mg", MAX_CAFFEINE_MG, "Caffeine"),
+        ],
+    )
+    def test_absurd_value_rejected(self, field, limit, label):
+        a = _BASE_SAVE.model_copy(update={field: limit + 1})
         result = sanity_check(a)
         assert result is not None
-        assert "Caffeine" in result
-
-    def test_exactly_at_limit_passes(self):
-        a = NutritionAnalysis(
-            action="save",
-            calories_kcal=MAX_CALORIES_KCAL,
-            protein_g=MAX_PROTEIN_G,
-            carbs_g=MAX_CARBS_G,
-            fat_g=MAX_FAT_G,
-            weight_g=MAX_WEIGHT_G,
-            volume_ml=MAX_VOLUME_ML,
-            caffeine_mg=MAX_CAFFEINE_MG,
-        )
-        assert sanity_check(a) is None
-
-    def test_none_values_pass(self):
-        """None fields should not trigger sanity failure."""
-        a = NutritionAnalysis(action="save", calories_kcal=200)
-        assert sanity_check(a) is None
+        assert label in result
 
     def test_ingredient_absurd_calories_rejected(self):
         a = NutritionAnalysis(
@@ -441,13 +470,11 @@ class TestSanityCheck:
         assert "juice" in result
 
     def test_ingredient_normal_values_pass(self):
-        a = NutritionAnalysis(
-            action="save", calories_kcal=500,
-            likely_ingredients=[
-                Ingredient(name="rice", amount="150g", calories_kcal=200, weight_g=150),
-                Ingredient(name="chicken", amount="100g", calories_kcal=165, weight_g=100),
-            ],
-        )
+        ingredients = _INGREDIENT_LIST_ADAPTER.validate_python([
+            {"name": "rice", "amount": "150g", "calories_kcal": 200, "weight_g": 150},
+            {"name": "chicken", "amount": "100g", "calories_kcal": 165, "weight_g": 100},
+        ])
+        a = NutritionAnalysis(action="save", calories_kcal=500, likely_ingredients=ingredients)
         assert sanity_check(a) is None
 
 
@@ -488,65 +515,39 @@ class TestBuildSystemPrompt:
 
     def test_all_lang_instructions_appended(self):
         """Each supported language has its instruction appended after the base."""
+        base_len = len(_SYSTEM_PROMPT_BASE)
         for lang, instruction in _LANG_INSTRUCTIONS.items():
             prompt = _build_system_prompt(lang)
-            assert prompt.startswith(_SYSTEM_PROMPT_BASE)
-            assert instruction in prompt
+            assert prompt[:base_len] == _SYSTEM_PROMPT_BASE
+            assert prompt.endswith(f"{instruction}\n")
 
 
 class TestLangPassedToOpenAI:
     """Verify analyze_text / analyze_photo pass lang-specific prompt to OpenAI."""
 
-    async def test_analyze_text_en_uses_en_prompt(self):
-        client = _mock_parse_response(NutritionAnalysis(action="reject_unrecognized"))
-        svc = _make_service(client)
-        await svc.analyze_text("chicken", lang="EN")
-
-        call_args = client.beta.chat.completions.parse.call_args
-        system_msg = call_args.kwargs["messages"][0]["content"]
-        assert "Respond in English" in system_msg
-
-    async def test_analyze_text_ru_uses_ru_prompt(self):
-        client = _mock_parse_response(NutritionAnalysis(action="reject_unrecognized"))
-        svc = _make_service(client)
-        await svc.analyze_text("курица", lang="RU")
-
-        call_args = client.beta.chat.completions.parse.call_args
-        system_msg = call_args.kwargs["messages"][0]["content"]
-        assert "русском" in system_msg
-
-    async def test_analyze_text_default_lang_is_en(self):
-        client = _mock_parse_response(NutritionAnalysis(action="reject_unrecognized"))
-        svc = _make_service(client)
-        await svc.analyze_text("chicken")  # no lang kwarg
-
-        call_args = client.beta.chat.completions.parse.call_args
-        system_msg = call_args.kwargs["messages"][0]["content"]
-        assert "Respond in English" in system_msg
-
-    async def test_analyze_photo_ru_uses_ru_prompt(self):
-        client = _mock_parse_response(NutritionAnalysis(action="reject_unrecognized"))
-        svc = _make_service(client)
-        await svc.analyze_photo(b"\xff\xd8fake_jpeg", caption="борщ", lang="RU")
-
-        call_args = client.beta.chat.completions.parse.call_args
-        system_msg = call_args.kwargs["messages"][0]["content"]
-        assert "русском" in system_msg
-
-    async def test_analyze_photo_default_lang_is_en(self):
-        client = _mock_parse_response(NutritionAnalysis(action="reject_unrecognized"))
-        svc = _make_service(client)
-        await svc.analyze_photo(b"\xff\xd8fake_jpeg")
-
-        call_args = client.beta.chat.completions.parse.call_args
-        system_msg = call_args.kwargs["messages"][0]["content"]
-        assert "Respond in English" in system_msg
-
-    async def test_analyze_text_unknown_lang_uses_en(self):
-        client = _mock_parse_response(NutritionAnalysis(action="reject_unrecognized"))
-        svc = _make_service(client)
-        await svc.analyze_text("food", lang="FR")
+    @pytest.mark.parametrize(
+        "method,args,lang,needle",
+        [
+            pytest.param("analyze_text", ("chicken",), "EN", "Respond in English", id="txt-en"),
+            pytest.param("analyze_text", ("курица",), "RU", "русском", id="txt-ru"),
+            pytest.param("analyze_text", ("chicken",), None, "Respond in English", id="txt-dflt"),
+            pytest.param("analyze_text", ("food",), "FR", "Respond in English", id="txt-unknown"),
+            pytest.param(
+                "analyze_photo", (_FAKE_JPEG, "борщ"), "RU", "русском", id="photo-ru",
+            ),
+            pytest.param(
+                "analyze_photo", (_FAKE_JPEG,), None, "Respond in English",
+                id="photo-dflt",
+            ),
+        ],
+    )
+    async def test_system_prompt_language(
+        self, client, svc, respond_with, method, args, lang, needle,
+    ):
+        respond_with(NutritionAnalysis(action="reject_unrecognized"))
+        kwargs = {"lang": lang} if lang else {}
+        await getattr(svc, method)(*args, **kwargs)
 
         call_args = client.beta.chat.completions.parse.call_args
         system_msg = call_args.kwargs["messages"][0]["content"]
-        assert "Respond in English" in system_msg
+        assert needle in system_msg
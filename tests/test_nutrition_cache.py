@@ -0,0 +1,94 @@
+"""Tests for app.services.nutrition_cache — OpenAI response cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+from app.services.nutrition_ai import NutritionAIService, NutritionAnalysis
+from app.services.nutrition_cache import AnalysisCache
+from tests.test_nutrition_ai import _build_response, _make_client
+
+_SAVE = NutritionAnalysis(action="save", meal_name="Chicken", calories_kcal=250)
+
+
+def _make_service(cache: AnalysisCache) -> tuple[NutritionAIService, AsyncMock]:
+    """Service with a mocked parse() that always returns ``_SAVE``."""
+    client = _make_client()
+    parse = client.beta.chat.completions.parse
+    parse.return_value = _build_response(_SAVE)
+    return NutritionAIService(client=client, cache=cache), parse
+
+
+# ---------------------------------------------------------------------------
+# AnalysisCache
+# ---------------------------------------------------------------------------
+
+
+class TestAnalysisCache:
+    def test_miss_then_hit(self):
+        cache = AnalysisCache()
+        key = cache.key("text", "EN", "chicken")
+        assert cache.get(key) is None
+        cache.set(key, _SAVE)
+        assert cache.get(key) is _SAVE
+
+    def test_key_is_unambiguous(self):
+        assert AnalysisCache.key("ab", "c") != AnalysisCache.key("a", "bc")
+
+    def test_key_accepts_bytes(self):
+        assert AnalysisCache.key(b"\xff\xd8") == AnalysisCache.key(b"\xff\xd8")
+
+    def test_entry_expires(self):
+        now = 100.0
+        cache = AnalysisCache(ttl_seconds=60, clock=lambda: now)
+        cache.set("k", _SAVE)
+        now = 159.0
+        assert cache.get("k") is _SAVE
+        now = 161.0
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = AnalysisCache(max_entries=2)
+        cache.set("a", _SAVE)
+        cache.set("b", _SAVE)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", _SAVE)
+        assert cache.get("b") is None
+        assert cache.get("a") is _SAVE
+        assert cache.get("c") is _SAVE
+
+
+# ---------------------------------------------------------------------------
+# NutritionAIService with cache
+# ---------------------------------------------------------------------------
+
+
+class TestServiceCaching:
+    async def test_repeated_text_calls_openai_once(self):
+        svc, parse = _make_service(AnalysisCache())
+        first = await svc.analyze_text("chicken")
+        second = await svc.analyze_text("chicken")
+        assert first is second
+        assert parse.call_count == 1
+
+    async def test_lang_is_part_of_key(self):
+        svc, parse = _make_service(AnalysisCache())
+        await svc.analyze_text("chicken", lang="EN")
+        await svc.analyze_text("chicken", lang="RU")
+        await svc.analyze_text("chicken", lang="ru")
+        assert parse.call_count == 2
+
+    async def test_repeated_photo_calls_openai_once(self):
+        svc, parse = _make_service(AnalysisCache())
+        await svc.analyze_photo(b"\xff\xd8fake_jpeg", caption="pizza")
+        await svc.analyze_photo(b"\xff\xd8fake_jpeg", caption="pizza")
+        await svc.analyze_photo(b"\xff\xd8fake_jpeg")
+        assert parse.call_count == 2
+
+    async def test_errors_are_not_cached(self):
+        svc, parse = _make_service(AnalysisCache())
+        parse.side_effect = [ValueError("boom"), parse.return_value]
+        assert (await svc.analyze_text("chicken")).action == "reject_unrecognized"
+        assert (await svc.analyze_text("chicken")).action == "save"
+        assert parse.call_count == 2
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import date
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -163,8 +164,9 @@ class TestProcMsgEditing:
         """Custom reject edits processing message."""
         msg = _make_message()
         proc = _make_proc_msg()
-        analysis = _make_analysis(action="reject_not_food")
-        analysis.user_message = "Not food"
+        analysis = _make_analysis(action="reject_not_food").model_copy(
+            update={"user_message": "Not food"}
+        )
 
         session = AsyncMock(spec=AsyncSession)
         await _handle_analysis_result(
@@ -251,36 +253,39 @@ class TestProcMsgEditing:
 # ---------------------------------------------------------------------------
 
 
+class _RejectingGuard:
+    """Concurrency guard stand-in whose slot is always taken (acquired=False)."""
+
+    def __call__(self, uid: int) -> _RejectingGuard:
+        return self
+
+    async def __aenter__(self) -> SimpleNamespace:
+        return SimpleNamespace(acquired=False)
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def rejecting_guard(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Install an AI service and a concurrency guard that always rejects."""
+    monkeypatch.setattr("app.bot.handlers.meal.ai_service", MagicMock())
+    monkeypatch.setattr("app.bot.handlers.meal.concurrency_guard", _RejectingGuard())
+
+
 class TestThrottleEditsProcMsg:
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("rejecting_guard")
     async def test_concurrency_guard_edits_proc_msg_with_throttle(self) -> None:
         """When concurrency guard rejects, proc_msg shows throttle text, not unrecognized."""
         msg = _make_message()
         proc = _make_proc_msg()
         bot = AsyncMock()
 
-        # Fake concurrency guard that rejects (acquired=False)
-        class FakeCtx:
-            acquired = False
-
-        class FakeGuard:
-            def __call__(self, uid: int):  # noqa: ANN204
-                return self
-
-            async def __aenter__(self):  # noqa: ANN204
-                return FakeCtx()
-
-            async def __aexit__(self, *args: object) -> None:
-                pass
-
-        with (
-            patch("app.bot.handlers.meal.ai_service", new=MagicMock()),
-            patch("app.bot.handlers.meal.concurrency_guard", new=FakeGuard()),
-        ):
-            result = await _analyze_with_typing(
-                msg, bot, lambda svc: svc.analyze_text("food"),
-                proc_msg=proc,
-            )
+        result = await _analyze_with_typing(
+            msg, bot, lambda svc: svc.analyze_text("food"),
+            proc_msg=proc,
+        )
 
         assert result is None
         proc.edit_text.assert_called_once()
@@ -288,32 +293,16 @@ class TestThrottleEditsProcMsg:
         msg.reply.assert_not_called()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("rejecting_guard")
     async def test_concurrency_guard_replies_without_proc_msg(self) -> None:
         """Without proc_msg, throttle falls back to message.reply."""
         msg = _make_message()
         bot = AsyncMock()
 
-        class FakeCtx:
-            acquired = False
-
-        class FakeGuard:
-            def __call__(self, uid: int):  # noqa: ANN204
-                return self
-
-            async def __aenter__(self):  # noqa: ANN204
-                return FakeCtx()
-
-            async def __aexit__(self, *args: object) -> None:
-                pass
-
-        with (
-            patch("app.bot.handlers.meal.ai_service", new=MagicMock()),
-            patch("app.bot.handlers.meal.concurrency_guard", new=FakeGuard()),
-        ):
-            result = await _analyze_with_typing(
-                msg, bot, lambda svc: svc.analyze_text("food"),
-                proc_msg=None,
-            )
+        result = await _analyze_with_typing(
+            msg, bot, lambda svc: svc.analyze_text("food"),
+            proc_msg=None,
+        )
 
         assert result is None
         msg.reply.assert_called_once()
@@ -11,18 +11,20 @@ Verifies:
 from __future__ import annotations
 
 import uuid
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import MealEntry, User
 from app.db.repos import MealRepo
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -186,90 +188,61 @@ class TestHardDeleteDeletedBefore:
 # ---------------------------------------------------------------------------
 
 
-class TestPurgeEndpoint:
-    """Test the /tasks/purge endpoint auth via header and behaviour."""
-
-    @pytest.mark.asyncio
-    async def test_wrong_secret_returns_403(self) -> None:
-        """Wrong X-Tasks-Secret header → 403."""
-        with patch("app.web.main.get_settings") as mock_settings:
-            mock_settings.return_value.TASKS_SECRET = "correct-secret-123"
-            from app.web.main import app
-
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/tasks/purge",
-                    headers={"X-Tasks-Secret": "wrong-secret"},
-                )
+def _patch_settings(monkeypatch: pytest.MonkeyPatch, tasks_secret: str) -> None:
+    """Make ``app.web.main.get_settings`` return a minimal settings stand-in."""
+    settings = SimpleNamespace(TASKS_SECRET=tasks_secret, PURGE_DELETED_AFTER_DAYS=30)
+    monkeypatch.setattr("app.web.main.get_settings", lambda: settings)
 
-        assert resp.status_code == 403
 
-    @pytest.mark.asyncio
-    async def test_missing_header_returns_403(self) -> None:
-        """No X-Tasks-Secret header → 403."""
-        with patch("app.web.main.get_settings") as mock_settings:
-            mock_settings.return_value.TASKS_SECRET = "correct-secret-123"
-            from app.web.main import app
-
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post("/tasks/purge")
-
-        assert resp.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_empty_tasks_secret_returns_403(self) -> None:
-        """Empty TASKS_SECRET (disabled) → always 403."""
-        with patch("app.web.main.get_settings") as mock_settings:
-            mock_settings.return_value.TASKS_SECRET = ""
-            from app.web.main import app
+class TestPurgeEndpoint:
+    """Test the /tasks/purge endpoint auth via header and behaviour."""
 
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/tasks/purge",
-                    headers={"X-Tasks-Secret": "anything"},
-                )
+    @pytest.mark.parametrize(
+        ("tasks_secret", "header"),
+        [
+            pytest.param("correct-secret-123", "wrong-secret", id="wrong_secret"),
+            pytest.param("correct-secret-123", None, id="missing_header"),
+            pytest.param("", "anything", id="empty_tasks_secret"),
+        ],
+    )
+    async def test_rejected_returns_403(
+        self,
+        web_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        tasks_secret: str,
+        header: str | None,
+    ) -> None:
+        """Wrong or missing X-Tasks-Secret, or empty TASKS_SECRET (disabled) → 403."""
+        _patch_settings(monkeypatch, tasks_secret)
+        headers = {"X-Tasks-Secret": header} if header is not None else {}
+        resp = await web_client.post("/tasks/purge", headers=headers)
 
         assert resp.status_code == 403
 
-    @pytest.mark.asyncio
-    async def test_valid_secret_calls_purge(self) -> None:
+    async def test_valid_secret_calls_purge(
+        self,
+        web_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_session_factory: Callable[[], AbstractAsyncContextManager[AsyncMock]],
+    ) -> None:
         """Valid X-Tasks-Secret → calls hard_delete_deleted_before, returns count."""
-        import app.web.main as web_main
+        mock_repo = MagicMock()
+        mock_repo.hard_delete_deleted_before = AsyncMock(return_value=5)
 
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_ctx = AsyncMock()
-        mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+        _patch_settings(monkeypatch, "my-secret-12345")
+        monkeypatch.setattr("app.web.main._session_factory", fake_session_factory)
+        monkeypatch.setattr("app.web.main.MealRepo", mock_repo)
 
-        original_factory = web_main._session_factory
-        web_main._session_factory = MagicMock(return_value=mock_ctx)
+        resp = await web_client.post(
+            "/tasks/purge",
+            headers={"X-Tasks-Secret": "my-secret-12345"},
+        )
 
-        try:
-            with (
-                patch("app.web.main.get_settings") as mock_settings,
-                patch("app.web.main.MealRepo") as mock_repo,
-            ):
-                mock_settings.return_value.TASKS_SECRET = "my-secret-12345"
-                mock_settings.return_value.PURGE_DELETED_AFTER_DAYS = 30
-                mock_repo.hard_delete_deleted_before = AsyncMock(return_value=5)
-
-                transport = ASGITransport(app=web_main.app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    resp = await client.post(
-                        "/tasks/purge",
-                        headers={"X-Tasks-Secret": "my-secret-12345"},
-                    )
-
-            assert resp.status_code == 200
-            data = resp.json()
-            assert data["status"] == "ok"
-            assert data["deleted_count"] == 5
-            mock_repo.hard_delete_deleted_before.assert_called_once()
-        finally:
-            web_main._session_factory = original_factory
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "ok"
+        assert data["deleted_count"] == 5
+        mock_repo.hard_delete_deleted_before.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -280,7 +253,6 @@ class TestPurgeEndpoint:
 class TestTaskEngineDispose:
     """Verify task engine is disposed on shutdown."""
 
-    @pytest.mark.asyncio
     async def test_engine_disposed_on_shutdown(self) -> None:
         """Lifespan shutdown disposes task engine and clears references."""
         import app.web.main as web_main
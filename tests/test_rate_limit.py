@@ -3,12 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import time
-from unittest.mock import patch
 
 from app.services.rate_limit import ConcurrencyGuard, RateLimiter
 
-
 # ---------------------------------------------------------------------------
 # RateLimiter
 # ---------------------------------------------------------------------------
@@ -35,17 +32,17 @@ class TestRateLimiter:
         assert rl.check(2) is True  # user 2 still ok
 
     def test_window_expires(self):
-        rl = RateLimiter(max_per_minute=2)
+        now = 100.0
+        rl = RateLimiter(max_per_minute=2, clock=lambda: now)
 
         # Fill window at "time 0"
-        with patch.object(time, "monotonic", return_value=100.0):
-            assert rl.check(1) is True
-            assert rl.check(1) is True
-            assert rl.check(1) is False
+        assert rl.check(1) is True
+        assert rl.check(1) is True
+        assert rl.check(1) is False
 
         # 61 seconds later — window expired
-        with patch.object(time, "monotonic", return_value=161.0):
-            assert rl.check(1) is True
+        now = 161.0
+        assert rl.check(1) is True
 
     def test_default_limit_is_6(self):
         rl = RateLimiter()
@@ -106,12 +103,16 @@ class TestConcurrencyGuard:
     async def test_concurrent_tasks(self):
         guard = ConcurrencyGuard()
         results: list[bool] = []
+        rejected = asyncio.Event()
 
         async def worker():
             async with guard(1) as ctx:
                 results.append(ctx.acquired)
                 if ctx.acquired:
-                    await asyncio.sleep(0.05)
+                    # Hold the slot until the other worker has been turned away.
+                    await rejected.wait()
+                else:
+                    rejected.set()
 
         await asyncio.gather(worker(), worker())
         assert results.count(True) == 1
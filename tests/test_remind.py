@@ -8,18 +8,20 @@ Verifies:
 from __future__ import annotations
 
 import uuid
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy import select
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import app.web.main as web_main
 from app.db.models import User
 from app.db.repos import UserRepo
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -43,13 +45,24 @@ def _make_user(
     )
 
 
+def _patch_settings(monkeypatch: pytest.MonkeyPatch, tasks_secret: str) -> None:
+    """Make ``app.web.main.get_settings`` return a minimal settings stand-in."""
+    settings = SimpleNamespace(
+        TASKS_SECRET=tasks_secret,
+        REMINDER_INACTIVITY_HOURS=6,
+        REMINDER_COOLDOWN_HOURS=6,
+    )
+    monkeypatch.setattr(web_main, "get_settings", lambda: settings)
+
+
 # ---------------------------------------------------------------------------
 # DB integration tests: claim_inactive_users
 # ---------------------------------------------------------------------------
 
 NOW = datetime.now(timezone.utc)
-INACTIVITY_CUTOFF = NOW - timedelta(hours=6)
-COOLDOWN_CUTOFF = NOW - timedelta(hours=6)
+HOURS_AGO = {n: NOW - timedelta(hours=n) for n in (1, 2, 6, 8, 10)}
+INACTIVITY_CUTOFF = HOURS_AGO[6]
+COOLDOWN_CUTOFF = HOURS_AGO[6]
 
 
 class TestClaimInactiveUsers:
@@ -57,7 +70,7 @@ class TestClaimInactiveUsers:
 
     async def test_eligible_user_claimed(self, session: AsyncSession) -> None:
         """User inactive >6h, no reminder → claimed and last_reminder_at set."""
-        user = _make_user(111, last_activity_at=NOW - timedelta(hours=8))
+        user = _make_user(111, last_activity_at=HOURS_AGO[8])
         session.add(user)
         await session.flush()
 
@@ -66,74 +79,55 @@ class TestClaimInactiveUsers:
         assert result[0].tg_user_id == 111
 
         # Verify last_reminder_at was set atomically
-        await session.flush()
-        row = await session.execute(select(User).where(User.tg_user_id == 111))
-        updated = row.scalar_one()
-        assert updated.last_reminder_at is not None
-
-    async def test_recently_active_user_excluded(self, session: AsyncSession) -> None:
-        """User active 2h ago → not eligible."""
-        user = _make_user(222, last_activity_at=NOW - timedelta(hours=2))
-        session.add(user)
-        await session.flush()
-
-        result = await UserRepo.claim_inactive_users(session, INACTIVITY_CUTOFF, COOLDOWN_CUTOFF)
-        assert len(result) == 0
-
-    async def test_recently_reminded_user_excluded(self, session: AsyncSession) -> None:
-        """User inactive but reminded 2h ago → still in cooldown."""
-        user = _make_user(
-            333,
-            last_activity_at=NOW - timedelta(hours=8),
-            last_reminder_at=NOW - timedelta(hours=2),
-        )
-        session.add(user)
-        await session.flush()
-
-        result = await UserRepo.claim_inactive_users(session, INACTIVITY_CUTOFF, COOLDOWN_CUTOFF)
-        assert len(result) == 0
-
-    async def test_old_reminder_user_eligible(self, session: AsyncSession) -> None:
-        """User inactive, last reminder >6h ago → eligible again."""
+        await session.refresh(user, attribute_names=["last_reminder_at"])
+        assert user.last_reminder_at is not None
+
+    @pytest.mark.parametrize(
+        ("activity_h", "reminder_h", "tz_mode", "expected"),
+        [
+            # User active 2h ago → not eligible.
+            pytest.param(2, None, "offset", 0, id="recently_active"),
+            # User inactive but reminded 2h ago → still in cooldown.
+            pytest.param(8, 2, "offset", 0, id="recently_reminded"),
+            # User inactive, last reminder >6h ago → eligible again.
+            pytest.param(10, 8, "offset", 1, id="old_reminder"),
+            # User with NULL last_activity_at → excluded (never active).
+            pytest.param(None, None, "offset", 0, id="no_activity"),
+            # User without timezone (tz_mode=None) → excluded.
+            pytest.param(8, None, None, 0, id="no_timezone"),
+        ],
+    )
+    async def test_eligibility(
+        self,
+        session: AsyncSession,
+        activity_h: int | None,
+        reminder_h: int | None,
+        tz_mode: str | None,
+        expected: int,
+    ) -> None:
+        """Single user with the given activity/reminder age and tz → claimed or not."""
         user = _make_user(
-            444,
-            last_activity_at=NOW - timedelta(hours=10),
-            last_reminder_at=NOW - timedelta(hours=8),
+            222,
+            tz_mode=tz_mode,
+            last_activity_at=HOURS_AGO[activity_h] if activity_h is not None else None,
+            last_reminder_at=HOURS_AGO[reminder_h] if reminder_h is not None else None,
         )
         session.add(user)
         await session.flush()
 
         result = await UserRepo.claim_inactive_users(session, INACTIVITY_CUTOFF, COOLDOWN_CUTOFF)
-        assert len(result) == 1
-
-    async def test_no_activity_user_excluded(self, session: AsyncSession) -> None:
-        """User with NULL last_activity_at → excluded (never active)."""
-        user = _make_user(555, last_activity_at=None)
-        session.add(user)
-        await session.flush()
-
-        result = await UserRepo.claim_inactive_users(session, INACTIVITY_CUTOFF, COOLDOWN_CUTOFF)
-        assert len(result) == 0
-
-    async def test_no_timezone_user_excluded(self, session: AsyncSession) -> None:
-        """User without timezone (tz_mode=None) → excluded."""
-        user = _make_user(666, tz_mode=None, last_activity_at=NOW - timedelta(hours=8))
-        session.add(user)
-        await session.flush()
-
-        result = await UserRepo.claim_inactive_users(session, INACTIVITY_CUTOFF, COOLDOWN_CUTOFF)
-        assert len(result) == 0
+        assert len(result) == expected
 
     async def test_mixed_users(self, session: AsyncSession) -> None:
         """Mix of eligible and ineligible users → only eligible claimed."""
-        eligible = _make_user(700, last_activity_at=NOW - timedelta(hours=10))
-        active = _make_user(701, last_activity_at=NOW - timedelta(hours=1))
+        eligible = _make_user(700, last_activity_at=HOURS_AGO[10])
+        active = _make_user(701, last_activity_at=HOURS_AGO[1])
         cooldown = _make_user(
             702,
-            last_activity_at=NOW - timedelta(hours=10),
-            last_reminder_at=NOW - timedelta(hours=1),
+            last_activity_at=HOURS_AGO[10],
+            last_reminder_at=HOURS_AGO[1],
         )
-        no_tz = _make_user(703, tz_mode=None, last_activity_at=NOW - timedelta(hours=10))
+        no_tz = _make_user(703, tz_mode=None, last_activity_at=HOURS_AGO[10])
 
         session.add_all([eligible, active, cooldown, no_tz])
         await session.flush()
@@ -144,7 +138,7 @@ class TestClaimInactiveUsers:
 
     async def test_second_claim_returns_empty(self, session: AsyncSession) -> None:
         """Second claim on same users → empty (already claimed, anti-duplicate)."""
-        user = _make_user(800, last_activity_at=NOW - timedelta(hours=8))
+        user = _make_user(800, last_activity_at=HOURS_AGO[8])
         session.add(user)
         await session.flush()
 
@@ -161,193 +155,131 @@ class TestClaimInactiveUsers:
 # ---------------------------------------------------------------------------
 
 
-class TestRemindEndpoint:
-    """Test the /tasks/remind endpoint auth and behaviour."""
+@pytest.fixture(scope="class")
+def _remind_bot() -> AsyncMock:
+    """Bot stand-in, built once per test class."""
+    return AsyncMock()
 
-    @pytest.mark.asyncio
-    async def test_wrong_secret_returns_403(self) -> None:
-        """Wrong X-Tasks-Secret → 403."""
-        with patch("app.web.main.get_settings") as mock_settings:
-            mock_settings.return_value.TASKS_SECRET = "correct-secret-123"
-            from app.web.main import app
 
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/tasks/remind",
-                    headers={"X-Tasks-Secret": "wrong-secret"},
-                )
+@pytest.fixture
+def remind_bot(
+    _remind_bot: AsyncMock,
+    fake_session_factory: Callable[[], AbstractAsyncContextManager[AsyncMock]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncMock:
+    """Install the shared bot and a fake session factory on ``app.web.main``."""
+    _remind_bot.reset_mock(side_effect=True)
+    monkeypatch.setattr(web_main, "_bot", _remind_bot)
+    monkeypatch.setattr(web_main, "_session_factory", fake_session_factory)
+    return _remind_bot
 
-        assert resp.status_code == 403
 
-    @pytest.mark.asyncio
-    async def test_missing_header_returns_403(self) -> None:
-        """No X-Tasks-Secret header → 403."""
-        with patch("app.web.main.get_settings") as mock_settings:
-            mock_settings.return_value.TASKS_SECRET = "correct-secret-123"
-            from app.web.main import app
+class TestRemindEndpoint:
+    """Test the /tasks/remind endpoint auth and behaviour."""
 
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post("/tasks/remind")
+    @pytest.mark.parametrize(
+        ("tasks_secret", "header"),
+        [
+            pytest.param("correct-secret-123", "wrong-secret", id="wrong_secret"),
+            pytest.param("correct-secret-123", None, id="missing_header"),
+            pytest.param("", "anything", id="empty_tasks_secret"),
+        ],
+    )
+    async def test_rejected_returns_403(
+        self,
+        web_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        tasks_secret: str,
+        header: str | None,
+    ) -> None:
+        """Wrong or missing X-Tasks-Secret, or empty TASKS_SECRET → 403."""
+        _patch_settings(monkeypatch, tasks_secret)
+        headers = {"X-Tasks-Secret": header} if header is not None else {}
+        resp = await web_client.post("/tasks/remind", headers=headers)
 
         assert resp.status_code == 403
 
-    @pytest.mark.asyncio
-    async def test_empty_tasks_secret_returns_403(self) -> None:
-        """Empty TASKS_SECRET → 403."""
-        with patch("app.web.main.get_settings") as mock_settings:
-            mock_settings.return_value.TASKS_SECRET = ""
-            from app.web.main import app
-
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.post(
-                    "/tasks/remind",
-                    headers={"X-Tasks-Secret": "anything"},
-                )
+    async def test_valid_secret_sends_reminders(
+        self,
+        web_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        remind_bot: AsyncMock,
+    ) -> None:
+        """Valid secret → claims users, sends reminders, returns count."""
+        # Claimed users: the endpoint only reads tg_user_id and language
+        user1 = SimpleNamespace(tg_user_id=111, language="EN")
+        user2 = SimpleNamespace(tg_user_id=222, language="EN")
+
+        _patch_settings(monkeypatch, "my-secret-12345")
+        monkeypatch.setattr(
+            web_main,
+            "UserRepo",
+            SimpleNamespace(claim_inactive_users=AsyncMock(return_value=[user1, user2])),
+        )
 
-        assert resp.status_code == 403
+        resp = await web_client.post(
+            "/tasks/remind",
+            headers={"X-Tasks-Secret": "my-secret-12345"},
+        )
 
-    @pytest.mark.asyncio
-    async def test_valid_secret_sends_reminders(self) -> None:
-        """Valid secret → claims users, sends reminders, returns count."""
-        import app.web.main as web_main
-
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_ctx = AsyncMock()
-        mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        original_factory = web_main._session_factory
-        original_bot = web_main._bot
-        web_main._session_factory = MagicMock(return_value=mock_ctx)
-
-        mock_bot = AsyncMock()
-        mock_bot.send_message = AsyncMock()
-        web_main._bot = mock_bot
-
-        # Create mock claimed users
-        user1 = MagicMock()
-        user1.tg_user_id = 111
-        user2 = MagicMock()
-        user2.tg_user_id = 222
-
-        try:
-            with (
-                patch("app.web.main.get_settings") as mock_settings,
-                patch("app.web.main.UserRepo") as mock_user_repo,
-            ):
-                mock_settings.return_value.TASKS_SECRET = "my-secret-12345"
-                mock_settings.return_value.REMINDER_INACTIVITY_HOURS = 6
-                mock_settings.return_value.REMINDER_COOLDOWN_HOURS = 6
-                mock_user_repo.claim_inactive_users = AsyncMock(return_value=[user1, user2])
-
-                transport = ASGITransport(app=web_main.app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    resp = await client.post(
-                        "/tasks/remind",
-                        headers={"X-Tasks-Secret": "my-secret-12345"},
-                    )
-
-            assert resp.status_code == 200
-            data = resp.json()
-            assert data["status"] == "ok"
-            assert data["sent"] == 2
-            assert data["failed"] == 0
-            assert mock_bot.send_message.call_count == 2
-        finally:
-            web_main._session_factory = original_factory
-            web_main._bot = original_bot
-
-    @pytest.mark.asyncio
-    async def test_partial_send_failure(self) -> None:
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "ok"
+        assert data["sent"] == 2
+        assert data["failed"] == 0
+        assert remind_bot.send_message.call_count == 2
+
+    async def test_partial_send_failure(
+        self,
+        web_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        remind_bot: AsyncMock,
+    ) -> None:
         """One send fails → still sends to others, reports failure count."""
-        import app.web.main as web_main
+        # First call succeeds, second raises
+        remind_bot.send_message.side_effect = [None, RuntimeError("Telegram API error")]
 
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_ctx = AsyncMock()
-        mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+        user1 = SimpleNamespace(tg_user_id=111, language="EN")
+        user2 = SimpleNamespace(tg_user_id=222, language="EN")
 
-        original_factory = web_main._session_factory
-        original_bot = web_main._bot
-        web_main._session_factory = MagicMock(return_value=mock_ctx)
+        _patch_settings(monkeypatch, "my-secret-12345")
+        monkeypatch.setattr(
+            web_main,
+            "UserRepo",
+            SimpleNamespace(claim_inactive_users=AsyncMock(return_value=[user1, user2])),
+        )
 
-        mock_bot = AsyncMock()
-        # First call succeeds, second raises
-        mock_bot.send_message = AsyncMock(
-            side_effect=[None, RuntimeError("Telegram API error")]
+        resp = await web_client.post(
+            "/tasks/remind",
+            headers={"X-Tasks-Secret": "my-secret-12345"},
         )
-        web_main._bot = mock_bot
-
-        user1 = MagicMock()
-        user1.tg_user_id = 111
-        user2 = MagicMock()
-        user2.tg_user_id = 222
-
-        try:
-            with (
-                patch("app.web.main.get_settings") as mock_settings,
-                patch("app.web.main.UserRepo") as mock_user_repo,
-            ):
-                mock_settings.return_value.TASKS_SECRET = "my-secret-12345"
-                mock_settings.return_value.REMINDER_INACTIVITY_HOURS = 6
-                mock_settings.return_value.REMINDER_COOLDOWN_HOURS = 6
-                mock_user_repo.claim_inactive_users = AsyncMock(return_value=[user1, user2])
-
-                transport = ASGITransport(app=web_main.app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    resp = await client.post(
-                        "/tasks/remind",
-                        headers={"X-Tasks-Secret": "my-secret-12345"},
-                    )
-
-            assert resp.status_code == 200
-            data = resp.json()
-            assert data["status"] == "ok"
-            assert data["sent"] == 1
-            assert data["failed"] == 1
-        finally:
-            web_main._session_factory = original_factory
-            web_main._bot = original_bot
-
-    @pytest.mark.asyncio
-    async def test_no_eligible_users(self) -> None:
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "ok"
+        assert data["sent"] == 1
+        assert data["failed"] == 1
+
+    async def test_no_eligible_users(
+        self,
+        web_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        remind_bot: AsyncMock,
+    ) -> None:
         """No eligible users → returns 0 sent, 0 failed."""
-        import app.web.main as web_main
-
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_ctx = AsyncMock()
-        mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        original_factory = web_main._session_factory
-        original_bot = web_main._bot
-        web_main._session_factory = MagicMock(return_value=mock_ctx)
-        web_main._bot = AsyncMock()
-
-        try:
-            with (
-                patch("app.web.main.get_settings") as mock_settings,
-                patch("app.web.main.UserRepo") as mock_user_repo,
-            ):
-                mock_settings.return_value.TASKS_SECRET = "my-secret-12345"
-                mock_settings.return_value.REMINDER_INACTIVITY_HOURS = 6
-                mock_settings.return_value.REMINDER_COOLDOWN_HOURS = 6
-                mock_user_repo.claim_inactive_users = AsyncMock(return_value=[])
-
-                transport = ASGITransport(app=web_main.app)
-                async with AsyncClient(transport=transport, base_url="http://test") as client:
-                    resp = await client.post(
-                        "/tasks/remind",
-                        headers={"X-Tasks-Secret": "my-secret-12345"},
-                    )
-
-            assert resp.status_code == 200
-            data = resp.json()
-            assert data["sent"] == 0
-            assert data["failed"] == 0
-        finally:
-            web_main._session_factory = original_factory
-            web_main._bot = original_bot
+        _patch_settings(monkeypatch, "my-secret-12345")
+        monkeypatch.setattr(
+            web_main,
+            "UserRepo",
+            SimpleNamespace(claim_inactive_users=AsyncMock(return_value=[])),
+        )
+
+        resp = await web_client.post(
+            "/tasks/remind",
+            headers={"X-Tasks-Secret": "my-secret-12345"},
+        )
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["sent"] == 0
+        assert data["failed"] == 0
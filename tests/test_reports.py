@@ -17,8 +17,12 @@ from tests.conftest import make_meal
 class TestTodayStats:
     async def test_two_meals_sum(self, session: AsyncSession, test_user: User):
         day = _dt.date(2024, 6, 15)
-        session.add(make_meal(test_user, day, calories=300, protein=20, carbs=30, fat=10))
-        session.add(make_meal(test_user, day, calories=200, protein=10, carbs=20, fat=5))
+        session.add_all(
+            [
+                make_meal(test_user, day, calories=300, protein=20, carbs=30, fat=10),
+                make_meal(test_user, day, calories=200, protein=10, carbs=20, fat=5),
+            ]
+        )
         await session.flush()
 
         result = await today_stats(session, test_user.id, day)
@@ -36,8 +40,12 @@ class TestTodayStats:
 
     async def test_deleted_meal_excluded(self, session: AsyncSession, test_user: User):
         day = _dt.date(2024, 6, 15)
-        session.add(make_meal(test_user, day, calories=300))
-        session.add(make_meal(test_user, day, calories=200, is_deleted=True))
+        session.add_all(
+            [
+                make_meal(test_user, day, calories=300),
+                make_meal(test_user, day, calories=200, is_deleted=True),
+            ]
+        )
         await session.flush()
 
         result = await today_stats(session, test_user.id, day)
@@ -53,8 +61,12 @@ class TestWeeklyStats:
         dates = [base - _dt.timedelta(days=i) for i in range(7)]
 
         # Add meals only for day 0 and day 3
-        session.add(make_meal(test_user, dates[0], calories=400))
-        session.add(make_meal(test_user, dates[3], calories=600))
+        session.add_all(
+            [
+                make_meal(test_user, dates[0], calories=400),
+                make_meal(test_user, dates[3], calories=600),
+            ]
+        )
         await session.flush()
 
         result = await weekly_stats(session, test_user.id, dates)
@@ -104,3 +116,26 @@ class TestFourWeekStats:
         # All zeros since no meals
         for week in result:
             assert week["avg_calories_kcal"] == 0.0
+
+    async def test_meals_bucketed_per_week(self, session: AsyncSession, test_user: User):
+        weeks = [
+            (_dt.date(2024, 6, 17), _dt.date(2024, 6, 23)),
+            (_dt.date(2024, 6, 10), _dt.date(2024, 6, 16)),
+            (_dt.date(2024, 6, 3), _dt.date(2024, 6, 9)),
+        ]
+        session.add_all(
+            [
+                make_meal(test_user, _dt.date(2024, 6, 17), calories=350),  # Monday edge
+                make_meal(test_user, _dt.date(2024, 6, 23), calories=350),  # Sunday edge
+                make_meal(test_user, _dt.date(2024, 6, 9), calories=1400),
+                make_meal(test_user, _dt.date(2024, 6, 12), calories=7000, is_deleted=True),
+            ]
+        )
+        await session.flush()
+
+        result = await four_week_stats(session, test_user.id, weeks)
+        assert [w["week_start"] for w in result] == [mon for mon, _ in weeks]
+        assert [w["avg_calories_kcal"] for w in result] == [100.0, 0.0, 200.0]
+
+    async def test_no_weeks(self, session: AsyncSession, test_user: User):
+        assert await four_week_stats(session, test_user.id, []) == []
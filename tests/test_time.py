@@ -37,6 +37,12 @@ class TestUserTimezone:
         tz = user_timezone("city", None, None)
         assert tz == _dt.timezone.utc
 
+    def test_repeated_lookups_reuse_tzinfo(self):
+        assert user_timezone("city", "Asia/Almaty", None) is user_timezone(
+            "city", "Asia/Almaty", None
+        )
+        assert user_timezone("offset", None, 180) is user_timezone("offset", None, 180)
+
 
 # ---------------------------------------------------------------------------
 # local_date_from_utc
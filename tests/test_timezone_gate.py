@@ -10,11 +10,14 @@ Verifies that:
 
 from __future__ import annotations
 
+import itertools
 import uuid
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiogram.types import Update
 
 from app.bot.middlewares import (
     ONBOARDING_TEXT_A,
@@ -30,56 +33,48 @@ from app.db.models import User
 # Helpers to build fake Update objects
 # ---------------------------------------------------------------------------
 
-def _make_user(tg_id: int = 111) -> MagicMock:
-    user = MagicMock()
-    user.id = tg_id
-    return user
+
+def _make_user(tg_id: int = 111) -> SimpleNamespace:
+    return SimpleNamespace(id=tg_id)
 
 
 def _make_message_update(
     text: str = "chicken salad",
     tg_user_id: int = 111,
     has_photo: bool = False,
-) -> MagicMock:
+) -> Update:
     """Build a fake Update with a message."""
-    from aiogram.types import Update
-
-    msg = AsyncMock()
-    msg.text = text
-    msg.from_user = _make_user(tg_user_id)
-    msg.answer = AsyncMock()
-    msg.photo = [MagicMock()] if has_photo else None
-
-    update = MagicMock(spec=Update)
-    update.message = msg
-    update.callback_query = None
-    return update
+    msg = SimpleNamespace(
+        text=text,
+        from_user=_make_user(tg_user_id),
+        answer=AsyncMock(),
+        photo=[SimpleNamespace()] if has_photo else None,
+    )
+    return Update.model_construct(update_id=0, message=msg, callback_query=None)
 
 
 def _make_callback_update(
     data: str = "goal:maintenance",
     tg_user_id: int = 111,
-) -> MagicMock:
+) -> Update:
     """Build a fake Update with a callback_query."""
-    from aiogram.types import Update
+    cb = SimpleNamespace(
+        data=data,
+        from_user=_make_user(tg_user_id),
+        answer=AsyncMock(),
+        message=SimpleNamespace(answer=AsyncMock()),
+    )
+    return Update.model_construct(update_id=0, message=None, callback_query=cb)
 
-    cb = AsyncMock()
-    cb.data = data
-    cb.from_user = _make_user(tg_user_id)
-    cb.answer = AsyncMock()
-    cb.message = AsyncMock()
-    cb.message.answer = AsyncMock()
 
-    update = MagicMock(spec=Update)
-    update.message = None
-    update.callback_query = cb
-    return update
+# Deterministic ids: cheaper than uuid4() and stable across runs.
+_next_uid = itertools.count(1)
 
 
 def _make_db_user(tz_mode: str | None = None) -> User:
     """Build a fake User ORM object."""
     user = User(
-        id=uuid.uuid4(),
+        id=uuid.UUID(int=next(_next_uid)),
         tg_user_id=111,
         tz_mode=tz_mode,
     )
@@ -101,11 +96,7 @@ class TestExtractUserId:
         assert TimezoneGateMiddleware._extract_user_id(update) == 99
 
     def test_no_user(self) -> None:
-        from aiogram.types import Update
-
-        update = MagicMock(spec=Update)
-        update.message = None
-        update.callback_query = None
+        update = Update.model_construct(update_id=0, message=None, callback_query=None)
         assert TimezoneGateMiddleware._extract_user_id(update) is None
 
 
@@ -210,6 +201,48 @@ class TestMiddlewareCall:
         handler.assert_called_once_with(update, data)
         assert result == "ok"
 
+    async def test_user_with_tz_cached_after_first_lookup(self) -> None:
+        """Onboarded user → later updates skip the DB lookup."""
+        mw = TimezoneGateMiddleware()
+        handler = AsyncMock(return_value="ok")
+        user = _make_db_user(tz_mode="offset")
+
+        with patch("app.bot.middlewares.UserRepo") as mock_repo:
+            mock_repo.get_or_create = AsyncMock(return_value=user)
+            for _ in range(3):
+                await mw(handler, _make_message_update(), {"session": AsyncMock()})
+
+        mock_repo.get_or_create.assert_awaited_once()
+        assert handler.await_count == 3
+
+    async def test_user_without_tz_not_cached(self) -> None:
+        """User without timezone → looked up again on every update."""
+        mw = TimezoneGateMiddleware()
+        handler = AsyncMock()
+        user = _make_db_user(tz_mode=None)
+
+        with patch("app.bot.middlewares.UserRepo") as mock_repo:
+            mock_repo.get_or_create = AsyncMock(return_value=user)
+            for _ in range(2):
+                await mw(handler, _make_message_update(), {"session": AsyncMock()})
+
+        assert mock_repo.get_or_create.await_count == 2
+        handler.assert_not_called()
+
+    async def test_tz_cache_evicts_oldest(self) -> None:
+        """Cache is bounded by max_cached_users (least recent evicted)."""
+        mw = TimezoneGateMiddleware(max_cached_users=2)
+        handler = AsyncMock()
+        user = _make_db_user(tz_mode="city")
+
+        with patch("app.bot.middlewares.UserRepo") as mock_repo:
+            mock_repo.get_or_create = AsyncMock(return_value=user)
+            for tg_id in (1, 2, 3, 1):
+                await mw(handler, _make_message_update(tg_user_id=tg_id), {"session": AsyncMock()})
+
+        # 1 was evicted by 3, so it is looked up again.
+        assert mock_repo.get_or_create.await_count == 4
+
     @pytest.mark.asyncio
     async def test_user_without_tz_intercepted_message(self) -> None:
         """User without timezone → message intercepted, onboarding shown."""
@@ -296,16 +329,34 @@ class TestMiddlewareCall:
         handler.assert_called_once()
         assert result == "tz_set"
 
+    @pytest.mark.parametrize(
+        "update",
+        [
+            _make_message_update(text="/start"),
+            _make_message_update(text="/language"),
+            _make_callback_update(data="tz_offset:+03:00"),
+            _make_callback_update(data="lang:RU"),
+        ],
+        ids=["start", "language", "tz_offset", "lang"],
+    )
+    async def test_always_allowed_skips_db_lookup(self, update: Update) -> None:
+        """Bypassed updates never touch the DB, even for a user without TZ."""
+        mw = TimezoneGateMiddleware()
+        handler = AsyncMock(return_value="ok")
+
+        with patch("app.bot.middlewares.UserRepo") as mock_repo:
+            mock_repo.get_or_create = AsyncMock(return_value=_make_db_user(tz_mode=None))
+            result = await mw(handler, update, {"session": AsyncMock()})
+
+        mock_repo.get_or_create.assert_not_awaited()
+        assert result == "ok"
+
     @pytest.mark.asyncio
     async def test_no_user_in_update_passes_through(self) -> None:
         """Update without from_user (e.g. channel post) passes through."""
-        from aiogram.types import Update
-
         mw = TimezoneGateMiddleware()
         handler = AsyncMock(return_value="ok")
-        update = MagicMock(spec=Update)
-        update.message = None
-        update.callback_query = None
+        update = Update.model_construct(update_id=0, message=None, callback_query=None)
         data: dict[str, Any] = {"session": AsyncMock()}
 
         result = await mw(handler, update, data)
@@ -0,0 +1,56 @@
+"""Tests for the timezone picker keyboards (spec D2 / FEAT-03).
+
+Verifies:
+- City and offset pickers link to each other with a localized button.
+- Each call returns fresh buttons and markup, so mutating one never leaks
+  into the next caller even though the layout is cached per language.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.bot.keyboards import timezone_city_keyboard, timezone_offset_keyboard
+from app.i18n import t
+
+
+class TestTimezoneKeyboards:
+    @pytest.mark.parametrize(
+        ("builder", "key", "callback"),
+        [
+            (timezone_city_keyboard, "kb_choose_offset", "tz_offset_menu"),
+            (timezone_offset_keyboard, "kb_choose_city", "tz_city_menu"),
+        ],
+        ids=["city", "offset"],
+    )
+    @pytest.mark.parametrize("lang", ["EN", "RU"])
+    def test_switch_button_is_localized(self, builder, key: str, callback: str, lang: str):
+        last = builder(lang).inline_keyboard[-1][0]
+        assert last.text == t(key, lang)
+        assert last.callback_data == callback
+
+    def test_offset_range(self) -> None:
+        buttons = [b for row in timezone_offset_keyboard().inline_keyboard[:-1] for b in row]
+        assert buttons[0].callback_data == "tz_offset:-720"
+        assert buttons[-1].callback_data == "tz_offset:840"
+
+    @pytest.mark.parametrize(
+        "builder", [timezone_city_keyboard, timezone_offset_keyboard], ids=["city", "offset"]
+    )
+    def test_mutating_result_does_not_leak(self, builder) -> None:
+        first = builder("EN")
+        n_rows = len(first.inline_keyboard)
+        button = first.inline_keyboard[0][0]
+        text, data = button.text, button.callback_data
+        button.text = "changed"
+        button.callback_data = "changed"
+        first.inline_keyboard.append([])
+        first.inline_keyboard[1].clear()
+
+        second = builder("EN")
+        assert second is not first
+        assert len(second.inline_keyboard) == n_rows
+        assert second.inline_keyboard[1]
+        fresh = second.inline_keyboard[0][0]
+        assert fresh is not button
+        assert (fresh.text, fresh.callback_data) == (text, data)
@@ -8,13 +8,16 @@ Verifies:
 
 from __future__ import annotations
 
+import itertools
 import uuid
 from datetime import date
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import app.bot.handlers.timezone as tz_handlers
 from app.bot.handlers.timezone import on_city_selected, on_offset_selected
 from app.db.models import User
 
@@ -23,84 +26,82 @@ from app.db.models import User
 # Helpers
 # ---------------------------------------------------------------------------
 
+# The handlers only forward the session to the (patched) repo and stats
+# helpers, so one spec'd mock can be shared by every test.
+_SESSION = AsyncMock(spec=AsyncSession)
+
+_EMPTY_STATS = {
+    "date": date.today(),
+    "calories_kcal": 0,
+    "protein_g": 0.0,
+    "carbs_g": 0.0,
+    "fat_g": 0.0,
+}
+
+
+def _make_callback(data: str, tg_user_id: int = 111) -> SimpleNamespace:
+    """Build a fake CallbackQuery (only the awaited methods are mocks)."""
+    return SimpleNamespace(
+        data=data,
+        from_user=SimpleNamespace(id=tg_user_id),
+        message=SimpleNamespace(edit_text=AsyncMock(), answer=AsyncMock()),
+        answer=AsyncMock(),
+    )
+
+
+def _edited_text(cb: SimpleNamespace) -> str:
+    """Return the text the handler passed (positionally) to ``message.edit_text``."""
+    return cb.message.edit_text.call_args.args[0]
 
-def _make_callback(data: str, tg_user_id: int = 111) -> AsyncMock:
-    """Build a fake CallbackQuery."""
-    cb = AsyncMock()
-    cb.data = data
-    cb.from_user = MagicMock()
-    cb.from_user.id = tg_user_id
-    cb.message = AsyncMock()
-    cb.message.edit_text = AsyncMock()
-    cb.message.answer = AsyncMock()
-    cb.answer = AsyncMock()
-    return cb
+
+# Deterministic ids: cheaper than uuid4() and stable across runs.
+_next_uid = itertools.count(1)
 
 
 def _make_user(tz_mode: str | None = None) -> User:
     return User(
-        id=uuid.uuid4(),
+        id=uuid.UUID(int=next(_next_uid)),
         tg_user_id=111,
         tz_mode=tz_mode,
     )
 
 
+@pytest.fixture
+def tz_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace ``UserRepo`` and ``today_stats`` in the timezone handler.
+
+    Returns a namespace with ``repo``, ``stats`` and the ``user`` returned
+    by ``repo.get_or_create``.  ``today_stats`` reports an empty day.
+    """
+    user = _make_user()
+    mock_repo = MagicMock()
+    mock_repo.get_or_create = AsyncMock(return_value=user)
+    mock_repo.update_timezone = AsyncMock()
+    mock_stats = AsyncMock(return_value=dict(_EMPTY_STATS))
+    monkeypatch.setattr(tz_handlers, "UserRepo", mock_repo)
+    monkeypatch.setattr(tz_handlers, "today_stats", mock_stats)
+    return SimpleNamespace(repo=mock_repo, stats=mock_stats, user=user)
+
+
 # ---------------------------------------------------------------------------
 # City selection confirmation
 # ---------------------------------------------------------------------------
 
 
 class TestCityConfirmation:
-    @pytest.mark.asyncio
-    async def test_confirmation_message_format(self) -> None:
+    async def test_confirmation_message_format(self, tz_mocks: SimpleNamespace) -> None:
         """City selection shows spec-mandated confirmation text."""
         cb = _make_callback("tz_city:Europe/Moscow")
-        user = _make_user()
-
-        with (
-            patch("app.bot.handlers.timezone.UserRepo") as mock_repo,
-            patch("app.bot.handlers.timezone.today_stats") as mock_stats,
-        ):
-            mock_repo.get_or_create = AsyncMock(return_value=user)
-            mock_repo.update_timezone = AsyncMock()
-            mock_stats.return_value = {
-                "date": date.today(),
-                "calories_kcal": 0,
-                "protein_g": 0.0,
-                "carbs_g": 0.0,
-                "fat_g": 0.0,
-            }
-
-            session = AsyncMock(spec=AsyncSession)
-            await on_city_selected(cb, session)
+        await on_city_selected(cb, _SESSION)
 
         # Check confirmation message.
-        edit_call = cb.message.edit_text.call_args
-        msg = edit_call.args[0] if edit_call.args else edit_call.kwargs.get("text", "")
+        msg = _edited_text(cb)
         assert msg == "✅ Time zone saved: Europe/Moscow. You can change it later."
 
-    @pytest.mark.asyncio
-    async def test_todays_stats_shown_after_city_save(self) -> None:
+    async def test_todays_stats_shown_after_city_save(self, tz_mocks: SimpleNamespace) -> None:
         """Today's Stats block is sent as follow-up after city TZ save."""
         cb = _make_callback("tz_city:America/New_York")
-        user = _make_user()
-
-        with (
-            patch("app.bot.handlers.timezone.UserRepo") as mock_repo,
-            patch("app.bot.handlers.timezone.today_stats") as mock_stats,
-        ):
-            mock_repo.get_or_create = AsyncMock(return_value=user)
-            mock_repo.update_timezone = AsyncMock()
-            mock_stats.return_value = {
-                "date": date.today(),
-                "calories_kcal": 0,
-                "protein_g": 0.0,
-                "carbs_g": 0.0,
-                "fat_g": 0.0,
-            }
-
-            session = AsyncMock(spec=AsyncSession)
-            await on_city_selected(cb, session)
+        await on_city_selected(cb, _SESSION)
 
         # Follow-up answer should contain Today's Stats.
         answer_call = cb.message.answer.call_args
@@ -110,32 +111,14 @@ class TestCityConfirmation:
         # Should have main_keyboard.
         assert "reply_markup" in answer_call.kwargs
 
-    @pytest.mark.asyncio
-    async def test_city_save_calls_update_timezone(self) -> None:
+    async def test_city_save_calls_update_timezone(self, tz_mocks: SimpleNamespace) -> None:
         """City selection correctly calls UserRepo.update_timezone."""
         cb = _make_callback("tz_city:Asia/Tokyo")
-        user = _make_user()
-
-        with (
-            patch("app.bot.handlers.timezone.UserRepo") as mock_repo,
-            patch("app.bot.handlers.timezone.today_stats") as mock_stats,
-        ):
-            mock_repo.get_or_create = AsyncMock(return_value=user)
-            mock_repo.update_timezone = AsyncMock()
-            mock_stats.return_value = {
-                "date": date.today(),
-                "calories_kcal": 0,
-                "protein_g": 0.0,
-                "carbs_g": 0.0,
-                "fat_g": 0.0,
-            }
-
-            session = AsyncMock(spec=AsyncSession)
-            await on_city_selected(cb, session)
-
-        mock_repo.update_timezone.assert_called_once_with(
-            session,
-            user.id,
+        await on_city_selected(cb, _SESSION)
+
+        tz_mocks.repo.update_timezone.assert_called_once_with(
+            _SESSION,
+            tz_mocks.user.id,
             tz_mode="city",
             tz_name="Asia/Tokyo",
             tz_offset_minutes=None,
@@ -148,141 +131,46 @@ class TestCityConfirmation:
 
 
 class TestOffsetConfirmation:
-    @pytest.mark.asyncio
-    async def test_confirmation_message_format_positive(self) -> None:
-        """Positive UTC offset shows spec-mandated confirmation text."""
-        cb = _make_callback("tz_offset:180")  # UTC+3
-        user = _make_user()
-
-        with (
-            patch("app.bot.handlers.timezone.UserRepo") as mock_repo,
-            patch("app.bot.handlers.timezone.today_stats") as mock_stats,
-        ):
-            mock_repo.get_or_create = AsyncMock(return_value=user)
-            mock_repo.update_timezone = AsyncMock()
-            mock_stats.return_value = {
-                "date": date.today(),
-                "calories_kcal": 0,
-                "protein_g": 0.0,
-                "carbs_g": 0.0,
-                "fat_g": 0.0,
-            }
-
-            session = AsyncMock(spec=AsyncSession)
-            await on_offset_selected(cb, session)
-
-        edit_call = cb.message.edit_text.call_args
-        msg = edit_call.args[0] if edit_call.args else edit_call.kwargs.get("text", "")
-        assert msg == "✅ Time zone saved: UTC+3. You can change it later."
-
-    @pytest.mark.asyncio
-    async def test_confirmation_message_format_negative(self) -> None:
-        """Negative UTC offset shows correct sign."""
-        cb = _make_callback("tz_offset:-300")  # UTC-5
-        user = _make_user()
-
-        with (
-            patch("app.bot.handlers.timezone.UserRepo") as mock_repo,
-            patch("app.bot.handlers.timezone.today_stats") as mock_stats,
-        ):
-            mock_repo.get_or_create = AsyncMock(return_value=user)
-            mock_repo.update_timezone = AsyncMock()
-            mock_stats.return_value = {
-                "date": date.today(),
-                "calories_kcal": 0,
-                "protein_g": 0.0,
-                "carbs_g": 0.0,
-                "fat_g": 0.0,
-            }
-
-            session = AsyncMock(spec=AsyncSession)
-            await on_offset_selected(cb, session)
-
-        edit_call = cb.message.edit_text.call_args
-        msg = edit_call.args[0] if edit_call.args else edit_call.kwargs.get("text", "")
-        assert msg == "✅ Time zone saved: UTC-5. You can change it later."
-
-    @pytest.mark.asyncio
-    async def test_confirmation_message_format_zero(self) -> None:
-        """UTC+0 shows correct format."""
-        cb = _make_callback("tz_offset:0")  # UTC+0
-        user = _make_user()
-
-        with (
-            patch("app.bot.handlers.timezone.UserRepo") as mock_repo,
-            patch("app.bot.handlers.timezone.today_stats") as mock_stats,
-        ):
-            mock_repo.get_or_create = AsyncMock(return_value=user)
-            mock_repo.update_timezone = AsyncMock()
-            mock_stats.return_value = {
-                "date": date.today(),
-                "calories_kcal": 0,
-                "protein_g": 0.0,
-                "carbs_g": 0.0,
-                "fat_g": 0.0,
-            }
-
-            session = AsyncMock(spec=AsyncSession)
-            await on_offset_selected(cb, session)
-
-        edit_call = cb.message.edit_text.call_args
-        msg = edit_call.args[0] if edit_call.args else edit_call.kwargs.get("text", "")
-        assert msg == "✅ Time zone saved: UTC+0. You can change it later."
-
-    @pytest.mark.asyncio
-    async def test_todays_stats_shown_after_offset_save(self) -> None:
+    @pytest.mark.parametrize(
+        ("minutes", "expected"),
+        [(180, "UTC+3"), (-300, "UTC-5"), (0, "UTC+0")],
+        ids=["positive", "negative", "zero"],
+    )
+    async def test_confirmation_message_format(
+        self, tz_mocks: SimpleNamespace, minutes: int, expected: str
+    ) -> None:
+        """UTC offset (with sign) shows spec-mandated confirmation text."""
+        cb = _make_callback(f"tz_offset:{minutes}")
+        await on_offset_selected(cb, _SESSION)
+
+        msg = _edited_text(cb)
+        assert msg == f"✅ Time zone saved: {expected}. You can change it later."
+
+    async def test_todays_stats_shown_after_offset_save(self, tz_mocks: SimpleNamespace) -> None:
         """Today's Stats block is sent after offset TZ save."""
         cb = _make_callback("tz_offset:300")
-        user = _make_user()
-
-        with (
-            patch("app.bot.handlers.timezone.UserRepo") as mock_repo,
-            patch("app.bot.handlers.timezone.today_stats") as mock_stats,
-        ):
-            mock_repo.get_or_create = AsyncMock(return_value=user)
-            mock_repo.update_timezone = AsyncMock()
-            mock_stats.return_value = {
-                "date": date.today(),
-                "calories_kcal": 250,
-                "protein_g": 20.0,
-                "carbs_g": 30.0,
-                "fat_g": 10.0,
-            }
-
-            session = AsyncMock(spec=AsyncSession)
-            await on_offset_selected(cb, session)
+        tz_mocks.stats.return_value = {
+            **_EMPTY_STATS,
+            "calories_kcal": 250,
+            "protein_g": 20.0,
+            "carbs_g": 30.0,
+            "fat_g": 10.0,
+        }
+        await on_offset_selected(cb, _SESSION)
 
         answer_call = cb.message.answer.call_args
         stats_msg = answer_call.args[0] if answer_call.args else ""
         assert "Today's Stats" in stats_msg
         assert "250kcal" in stats_msg
 
-    @pytest.mark.asyncio
-    async def test_offset_save_calls_update_timezone(self) -> None:
+    async def test_offset_save_calls_update_timezone(self, tz_mocks: SimpleNamespace) -> None:
         """Offset selection correctly calls UserRepo.update_timezone."""
         cb = _make_callback("tz_offset:540")  # UTC+9
-        user = _make_user()
-
-        with (
-            patch("app.bot.handlers.timezone.UserRepo") as mock_repo,
-            patch("app.bot.handlers.timezone.today_stats") as mock_stats,
-        ):
-            mock_repo.get_or_create = AsyncMock(return_value=user)
-            mock_repo.update_timezone = AsyncMock()
-            mock_stats.return_value = {
-                "date": date.today(),
-                "calories_kcal": 0,
-                "protein_g": 0.0,
-                "carbs_g": 0.0,
-                "fat_g": 0.0,
-            }
-
-            session = AsyncMock(spec=AsyncSession)
-            await on_offset_selected(cb, session)
-
-        mock_repo.update_timezone.assert_called_once_with(
-            session,
-            user.id,
+        await on_offset_selected(cb, _SESSION)
+
+        tz_mocks.repo.update_timezone.assert_called_once_with(
+            _SESSION,
+            tz_mocks.user.id,
             tz_mode="offset",
             tz_name=None,
             tz_offset_minutes=540,
@@ -295,38 +183,19 @@ class TestOffsetConfirmation:
 
 
 class TestEdgeCases:
-    @pytest.mark.asyncio
-    async def test_city_no_data_no_from_user(self) -> None:
-        """City callback with no data or from_user returns early."""
-        cb = _make_callback("tz_city:Europe/London")
-        cb.data = None
-        session = AsyncMock(spec=AsyncSession)
-        await on_city_selected(cb, session)
-        cb.message.edit_text.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_offset_no_data(self) -> None:
-        """Offset callback with no data returns early."""
-        cb = _make_callback("tz_offset:0")
-        cb.data = None
-        session = AsyncMock(spec=AsyncSession)
-        await on_offset_selected(cb, session)
-        cb.message.edit_text.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_no_from_user_city(self) -> None:
-        """City callback with no from_user returns early."""
-        cb = _make_callback("tz_city:Europe/London")
-        cb.from_user = None
-        session = AsyncMock(spec=AsyncSession)
-        await on_city_selected(cb, session)
-        cb.message.edit_text.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_no_from_user_offset(self) -> None:
-        """Offset callback with no from_user returns early."""
-        cb = _make_callback("tz_offset:60")
-        cb.from_user = None
-        session = AsyncMock(spec=AsyncSession)
-        await on_offset_selected(cb, session)
+    @pytest.mark.parametrize(
+        ("handler", "data", "missing"),
+        [
+            (on_city_selected, "tz_city:Europe/London", "data"),
+            (on_offset_selected, "tz_offset:0", "data"),
+            (on_city_selected, "tz_city:Europe/London", "from_user"),
+            (on_offset_selected, "tz_offset:60", "from_user"),
+        ],
+        ids=["city_no_data", "offset_no_data", "city_no_from_user", "offset_no_from_user"],
+    )
+    async def test_returns_early(self, handler, data: str, missing: str) -> None:
+        """Callback without data or from_user returns before saving anything."""
+        cb = _make_callback(data)
+        setattr(cb, missing, None)
+        await handler(cb, _SESSION)
         cb.message.edit_text.assert_not_called()
@@ -14,13 +14,21 @@ from app.core.version import get_version
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture
+def uncached_version():
+    """Clear get_version's cache around a test that patches _PYPROJECT_PATH.
+
+    The cache is cleared again afterwards so the patched result (or the
+    lack of one) never leaks into tests that read the real pyproject.
+    """
+    get_version.cache_clear()
+    yield
+    get_version.cache_clear()
+
+
 class TestGetVersion:
     """Verify get_version reads from pyproject.toml."""
 
-    def setup_method(self):
-        """Clear the functools.cache between tests."""
-        get_version.cache_clear()
-
     def test_returns_version_string(self):
         version = get_version()
         assert version == "1.1.3"
@@ -36,21 +44,23 @@ class TestGetVersion:
         v2 = get_version()
         assert v1 is v2  # Same object — cached
 
-    def test_missing_pyproject_raises(self, tmp_path):
+    def test_missing_pyproject_raises(self, tmp_path, uncached_version):
         """RuntimeError when pyproject.toml doesn't exist."""
-        with patch("app.core.version._PYPROJECT_PATH", tmp_path / "missing.toml"):
-            get_version.cache_clear()
-            with pytest.raises(RuntimeError, match="not found"):
-                get_version()
+        with (
+            patch("app.core.version._PYPROJECT_PATH", tmp_path / "missing.toml"),
+            pytest.raises(RuntimeError, match="not found"),
+        ):
+            get_version()
 
-    def test_no_version_field_raises(self, tmp_path):
+    def test_no_version_field_raises(self, tmp_path, uncached_version):
         """RuntimeError when pyproject.toml has no version field."""
         fake = tmp_path / "pyproject.toml"
         fake.write_text("[project]\nname = 'test'\n")
-        with patch("app.core.version._PYPROJECT_PATH", fake):
-            get_version.cache_clear()
-            with pytest.raises(RuntimeError, match="version field not found"):
-                get_version()
+        with (
+            patch("app.core.version._PYPROJECT_PATH", fake),
+            pytest.raises(RuntimeError, match="version field not found"),
+        ):
+            get_version()
 
 
 # ---------------------------------------------------------------------------
@@ -61,7 +71,6 @@ class TestGetVersion:
 class TestVersionHandler:
     """Verify /version command replies with version string."""
 
-    @pytest.mark.asyncio
     async def test_cmd_version_replies(self):
         from app.bot.handlers.version import cmd_version
 
@@ -75,7 +84,6 @@ class TestVersionHandler:
         assert "1.1.3" in reply_text
         assert "KBJU Bot" in reply_text
 
-    @pytest.mark.asyncio
     async def test_version_bypasses_timezone_gate(self):
         """Ensure /version is in the timezone gate bypass list."""
         from app.bot.middlewares import _ALLOWED_COMMANDS